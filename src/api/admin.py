@@ -8,10 +8,12 @@ from ..services import app_settings as app_settings_service
 from ..services import decks as deck_service
 from ..services import models as model_service
 from ..services import users as user_service
-from ..settings import ALWAYS_ADMIN_EMAILS, NATIVE_LANGUAGE_OPTIONS
+from ..settings import ALWAYS_ADMIN_EMAILS, NATIVE_LANGUAGE_SET
 from .dependencies import get_current_user, parse_uuid, require_admin
 router = APIRouter(prefix="/admin")
 
+PROTECTED_EMAILS = sorted(ALWAYS_ADMIN_EMAILS)
+
 
 class AdminEmailPayload(BaseModel):
     email: str
@@ -60,21 +62,21 @@ def list_users(
     result = user_service.list_all_users(page=page, limit=limit)
     return {
         **result,
-        "protectedEmails": list(ALWAYS_ADMIN_EMAILS),
+        "protectedEmails": PROTECTED_EMAILS,
     }
 
 
 @router.get("/users/{user_id}")
 def user_detail(user_id: str, user=Depends(require_admin)):
     user_uuid = parse_uuid(user_id, entity="User")
-    managed = user_service.get_user(user_uuid)
+    managed = user_service.get_user_with_emails(user_uuid)
     if not managed:
         raise HTTPException(status_code=404, detail="User not found.")
-    emails = user_service.list_user_emails(user_uuid)
+    emails = managed.pop("emails")
     return {
         "user": managed,
         "emails": emails,
-        "protectedEmails": list(ALWAYS_ADMIN_EMAILS),
+        "protectedEmails": PROTECTED_EMAILS,
         "apiKey": api_key_service.get_api_key_summary(user_uuid),
     }
 
@@ -102,12 +104,11 @@ def add_user_email(
     if not user_service.get_user(user_uuid):
         raise HTTPException(status_code=404, detail="User not found.")
     try:
-        user_service.add_user_email(
+        emails = user_service.add_user_email(
             user_uuid, payload.email, make_primary=payload.make_primary
         )
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
-    emails = user_service.list_user_emails(user_uuid)
     return {"status": "ok", "emails": emails}
 
 
@@ -124,8 +125,8 @@ def update_user_email(
         user_service.update_user_email(email_uuid, payload.email)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
-    managed = user_service.get_user(user_uuid)
-    emails = user_service.list_user_emails(user_uuid)
+    managed = user_service.get_user_with_emails(user_uuid)
+    emails = managed.pop("emails") if managed else []
     return {"status": "ok", "user": managed, "emails": emails}
 
 
@@ -134,10 +135,9 @@ def delete_user_email(user_id: str, email_id: str, user=Depends(require_admin)):
     user_uuid = parse_uuid(user_id, entity="User")
     email_uuid = parse_uuid(email_id, entity="Email")
     try:
-        user_service.remove_user_email(user_uuid, email_uuid)
+        emails = user_service.remove_user_email(user_uuid, email_uuid)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
-    emails = user_service.list_user_emails(user_uuid)
     return {"status": "ok", "emails": emails}
 
 
@@ -146,10 +146,9 @@ def set_primary_email(user_id: str, email_id: str, user=Depends(require_admin)):
     user_uuid = parse_uuid(user_id, entity="User")
     email_uuid = parse_uuid(email_id, entity="Email")
     try:
-        user_service.set_primary_email(user_uuid, email_uuid)
+        emails = user_service.set_primary_email(user_uuid, email_uuid)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
-    emails = user_service.list_user_emails(user_uuid)
     return {"status": "ok", "emails": emails}
 
 
@@ -166,8 +165,7 @@ def toggle_admin(
         raise HTTPException(
             status_code=400, detail="Cannot revoke admin from a protected account."
         )
-    user_service.set_admin_status(user_uuid, payload.make_admin)
-    updated = user_service.get_user(user_uuid)
+    updated = user_service.set_admin_status(user_uuid, payload.make_admin)
     return {"status": "ok", "user": updated}
 
 
@@ -207,7 +205,7 @@ def update_user_settings(
 
     if payload.native_language is not None:
         lang = payload.native_language.strip()
-        if lang and lang not in NATIVE_LANGUAGE_OPTIONS:
+        if lang and lang not in NATIVE_LANGUAGE_SET:
             raise HTTPException(status_code=400, detail="Unsupported native language.")
         if lang:
             user_service.set_native_language(user_uuid, lang)
@@ -1,14 +1,26 @@
-import base64
-import io
+import asyncio
+import binascii
+import functools
+import hashlib
 import logging
-from typing import Dict, List, Literal, Optional
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+import urllib.parse
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Literal, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 import httpx
-from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import StreamingResponse
-from pydantic import BaseModel, Field, field_validator
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from ..services import api_keys as api_key_service
 from ..services import cards as card_service
@@ -32,7 +44,60 @@ AUDIO_VOICES = [
     "sage",
     "shimmer",
 ]
+AUDIO_VOICE_SET = frozenset(AUDIO_VOICES)
 MAX_REMOTE_AUDIO_BYTES = 10 * 1024 * 1024
+FFMPEG_BINARY = shutil.which("ffmpeg") or "ffmpeg"
+AUDIO_CONVERT_TIMEOUT_SECONDS = 60
+# MP4/M4A can keep their index at the end of the file, which ffmpeg cannot
+# seek back to when reading from a pipe.
+SEEKABLE_INPUT_FORMATS = {"mp4"}
+CONTENT_TYPE_FORMATS = {
+    "audio/mpeg": "mp3",
+    "audio/mp3": "mp3",
+    "audio/wav": "wav",
+    "audio/x-wav": "wav",
+    "audio/wave": "wav",
+    "audio/aac": "aac",
+    "audio/x-aac": "aac",
+    "audio/m4a": "mp4",
+    "audio/mp4": "mp4",
+    "audio/ogg": "ogg",
+    "audio/webm": "webm",
+    "audio/flac": "flac",
+}
+EXTENSION_FORMATS = {
+    "mp3": "mp3",
+    "wav": "wav",
+    "aac": "aac",
+    "m4a": "mp4",
+    "mp4": "mp4",
+    "ogg": "ogg",
+    "opus": "ogg",
+    "flac": "flac",
+    "webm": "webm",
+}
+# ffmpeg is CPU-bound; cap concurrent transcodes instead of sharing the
+# general threadpool that sync endpoints run on.
+_AUDIO_POOL = ThreadPoolExecutor(
+    max_workers=min(8, os.cpu_count() or 4), thread_name_prefix="audio-xcode"
+)
+# One keep-alive client per worker so repeat fetches from the same host skip
+# the TCP/TLS handshake. Created lazily inside the running event loop.
+_audio_http_client: Optional[httpx.AsyncClient] = None
+# Converted MP3s for recently fetched links, so retrying the same URL skips
+# the download and the ffmpeg transcode. Only touched from the event loop.
+REMOTE_AUDIO_SCHEMES = frozenset({"http", "https"})
+REMOTE_AUDIO_CACHE_SIZE = 32
+REMOTE_AUDIO_CACHE_TTL_SECONDS = 15 * 60
+_remote_audio_cache: "OrderedDict[str, tuple]" = OrderedDict()
+
+
+# action -> (payload field to regenerate, success message)
+REGEN_FIELD_ACTIONS = {
+    "regen_native_phrase": ("native_phrase", "Translation updated."),
+    "regen_dictionary_entry": ("dictionary_entry", "Dictionary entry updated."),
+    "regen_example_sentence": ("example_sentence", "Example sentence updated."),
+}
 
 
 class AudioPreferences(BaseModel):
@@ -45,6 +110,10 @@ _MAX_INSTRUCTIONS_LEN = 2_000
 
 
 class CardActionRequest(BaseModel):
+    # Strings (including payload values) are stripped during validation, so
+    # the handlers below can use them as-is.
+    model_config = ConfigDict(populate_by_name=True, str_strip_whitespace=True)
+
     deck_id: str = Field(..., alias="deckId")
     group_id: Optional[str] = Field(None, alias="groupId")
     mode: Literal["create", "edit"] = "create"
@@ -110,14 +179,16 @@ def _save_card_tags(group_id, tag_ids: List[str]) -> None:
 def _encode_audio_preview(audio_bytes: Optional[bytes]) -> str:
     if not audio_bytes:
         return ""
-    return base64.b64encode(audio_bytes).decode("utf-8")
+    # binascii directly: skips the base64 module's wrapper and the newline
+    # it would otherwise strip; base64 output is pure ASCII.
+    return binascii.b2a_base64(audio_bytes, newline=False).decode("ascii")
 
 
 def _decode_audio_preview(data: Optional[str]) -> Optional[bytes]:
     if not data:
         return None
     try:
-        return base64.b64decode(data)
+        return binascii.a2b_base64(data)
     except Exception:
         return None
 
@@ -126,72 +197,77 @@ def _infer_audio_format(
     filename: Optional[str], content_type: Optional[str]
 ) -> Optional[str]:
     if content_type:
-        normalized = content_type.split(";")[0].strip().lower()
-        content_map = {
-            "audio/mpeg": "mp3",
-            "audio/mp3": "mp3",
-            "audio/wav": "wav",
-            "audio/x-wav": "wav",
-            "audio/wave": "wav",
-            "audio/aac": "aac",
-            "audio/x-aac": "aac",
-            "audio/m4a": "m4a",
-            "audio/mp4": "mp4",
-            "audio/ogg": "ogg",
-            "audio/webm": "webm",
-            "audio/flac": "flac",
-        }
-        if normalized in content_map:
-            return content_map[normalized]
+        normalized = content_type.partition(";")[0].strip().lower()
+        if normalized in CONTENT_TYPE_FORMATS:
+            return CONTENT_TYPE_FORMATS[normalized]
     if filename:
-        ext = filename.split(".")[-1].lower()
-        extension_map = {
-            "mp3": "mp3",
-            "wav": "wav",
-            "aac": "aac",
-            "m4a": "mp4",
-            "mp4": "mp4",
-            "ogg": "ogg",
-            "opus": "ogg",
-            "flac": "flac",
-            "webm": "webm",
-        }
-        if ext in extension_map:
-            return extension_map[ext]
+        ext = filename.rpartition(".")[2].lower()
+        if ext in EXTENSION_FORMATS:
+            return EXTENSION_FORMATS[ext]
     return None
 
 
+def _looks_like_mp3(data: bytes) -> bool:
+    """ID3 tag, or an MPEG audio Layer III frame header at the start."""
+    if data.startswith(b"ID3"):
+        return True
+    return (
+        len(data) >= 4
+        and data[0] == 0xFF
+        and (data[1] & 0xE6) == 0xE2  # frame sync + Layer III (not AAC/ADTS)
+        and (data[1] & 0x18) != 0x08  # reserved MPEG version
+        and (data[2] & 0xF0) not in (0x00, 0xF0)  # free/invalid bitrate
+    )
+
+
 def _convert_audio_bytes_to_mp3(
     data: bytes, *, source_format: Optional[str] = None
 ) -> bytes:
-    from pydub import AudioSegment
-    from pydub.exceptions import CouldntDecodeError
-
-    buffer = io.BytesIO(data)
-    buffer.seek(0)
+    """Transcode to MP3 with a single ffmpeg process, piping bytes in and out."""
+    # Re-encoding an MP3 only costs time and quality.
+    if source_format in (None, "mp3") and _looks_like_mp3(data):
+        return data
+    command = [FFMPEG_BINARY, "-hide_banner", "-loglevel", "error"]
+    if source_format:
+        command += ["-f", source_format]
+    source = None
+    stdin: Optional[bytes] = data
+    if source_format in SEEKABLE_INPUT_FORMATS:
+        source = tempfile.NamedTemporaryFile(suffix=f".{source_format}")
+        source.write(data)
+        source.flush()
+        command += ["-i", source.name]
+        stdin = None
+    else:
+        command += ["-i", "pipe:0"]
+    command += ["-vn", "-f", "mp3", "pipe:1"]
     try:
-        if source_format:
-            segment = AudioSegment.from_file(buffer, format=source_format)
-        else:
-            segment = AudioSegment.from_file(buffer)
-    except CouldntDecodeError as exc:
+        result = subprocess.run(
+            command,
+            input=stdin,
+            capture_output=True,
+            timeout=AUDIO_CONVERT_TIMEOUT_SECONDS,
+        )
+    except (OSError, subprocess.TimeoutExpired) as exc:
+        raise ValueError("Failed to process the uploaded audio file.") from exc
+    finally:
+        if source is not None:
+            source.close()
+    if result.returncode != 0 or not result.stdout:
         raise ValueError(
             "Unable to decode the uploaded audio. Please upload a valid audio file."
-        ) from exc
-    except Exception as exc:
-        raise ValueError("Failed to process the uploaded audio file.") from exc
-    output = io.BytesIO()
-    segment.export(output, format="mp3")
-    return output.getvalue()
+        )
+    return result.stdout
 
 
-def _is_private_host(hostname: str) -> bool:
+async def _is_private_host(hostname: str) -> bool:
     """Return True if the hostname resolves to a private/loopback/link-local address."""
     import ipaddress
     import socket
 
     try:
-        infos = socket.getaddrinfo(hostname, None)
+        # The loop resolves in its executor; a slow DNS answer must not stall it.
+        infos = await asyncio.get_running_loop().getaddrinfo(hostname, None)
     except socket.gaierror:
         return False  # can't resolve — let httpx fail naturally
     for info in infos:
@@ -210,26 +286,71 @@ def _is_private_host(hostname: str) -> bool:
     return False
 
 
-async def _download_audio_from_url(url: str) -> bytes:
-    import urllib.parse
+def _get_audio_http_client() -> httpx.AsyncClient:
+    global _audio_http_client
+    if _audio_http_client is None:
+        _audio_http_client = httpx.AsyncClient(
+            timeout=15.0,
+            follow_redirects=True,
+            max_redirects=3,
+            # Retries failed connection attempts only; a response is never re-sent.
+            transport=httpx.AsyncHTTPTransport(
+                retries=2,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            ),
+        )
+    return _audio_http_client
+
 
-    normalized = (url or "").strip()
+async def close_audio_http_client() -> None:
+    global _audio_http_client
+    if _audio_http_client is not None:
+        await _audio_http_client.aclose()
+        _audio_http_client = None
+
+
+async def _download_audio_from_url(url: str) -> bytes:
+    normalized = url or ""
     if not normalized:
         raise ValueError("Enter an audio URL to fetch.")
-    if not normalized.lower().startswith(("http://", "https://")):
+    parsed = urllib.parse.urlsplit(normalized)
+    if parsed.scheme.lower() not in REMOTE_AUDIO_SCHEMES or not parsed.netloc:
         raise ValueError("Audio URL must start with http:// or https://.")
-    parsed = urllib.parse.urlparse(normalized)
     hostname = parsed.hostname or ""
     if not hostname:
         raise ValueError("Invalid audio URL: missing hostname.")
-    if _is_private_host(hostname):
+    cached = _remote_audio_cache.get(normalized)
+    if cached and time.monotonic() - cached[0] < REMOTE_AUDIO_CACHE_TTL_SECONDS:
+        _remote_audio_cache.move_to_end(normalized)
+        return cached[1]
+    if await _is_private_host(hostname):
         raise ValueError("Audio URL must point to a public host.")
+    # An expired entry is revalidated rather than downloaded and transcoded again.
+    request_headers = cached[2] if cached else {}
+    too_large = "Audio file is too large. Please provide a clip under 10 MB."
     try:
-        async with httpx.AsyncClient(
-            timeout=15.0, follow_redirects=True, max_redirects=3
-        ) as client:
-            response = await client.get(normalized)
+        client = _get_audio_http_client()
+        async with client.stream(
+            "GET", normalized, headers=request_headers
+        ) as response:
+            if cached and response.status_code == 304:
+                _remember_remote_audio(normalized, cached[1], request_headers)
+                return cached[1]
             response.raise_for_status()
+            declared = response.headers.get("Content-Length")
+            if (
+                declared
+                and declared.isdigit()
+                and int(declared) > MAX_REMOTE_AUDIO_BYTES
+            ):
+                raise ValueError(too_large)
+            # Read in chunks and stop at the cap instead of buffering
+            # whatever the remote server decides to send.
+            buffer = bytearray()
+            async for chunk in response.aiter_bytes(64 * 1024):
+                buffer.extend(chunk)
+                if len(buffer) > MAX_REMOTE_AUDIO_BYTES:
+                    raise ValueError(too_large)
     except httpx.HTTPStatusError as exc:
         status = exc.response.status_code if exc.response else "unknown"
         raise ValueError(f"Unable to download audio (HTTP {status}).") from exc
@@ -237,23 +358,41 @@ async def _download_audio_from_url(url: str) -> bytes:
         raise ValueError(
             "Unable to reach the audio URL. Check the link and try again."
         ) from exc
-    data = response.content
+    data = bytes(buffer)
     if not data:
         raise ValueError("Downloaded file was empty.")
-    if len(data) > MAX_REMOTE_AUDIO_BYTES:
-        raise ValueError("Audio file is too large. Please provide a clip under 10 MB.")
     format_hint = _infer_audio_format(normalized, response.headers.get("Content-Type"))
-    return _convert_audio_bytes_to_mp3(data, source_format=format_hint)
+    loop = asyncio.get_running_loop()
+    converted = await loop.run_in_executor(
+        _AUDIO_POOL,
+        functools.partial(_convert_audio_bytes_to_mp3, data, source_format=format_hint),
+    )
+    validators = {}
+    if response.headers.get("ETag"):
+        validators["If-None-Match"] = response.headers["ETag"]
+    if response.headers.get("Last-Modified"):
+        validators["If-Modified-Since"] = response.headers["Last-Modified"]
+    _remember_remote_audio(normalized, converted, validators)
+    return converted
+
+
+def _remember_remote_audio(url: str, audio: bytes, validators: Dict[str, str]) -> None:
+    _remote_audio_cache[url] = (time.monotonic(), audio, validators)
+    _remote_audio_cache.move_to_end(url)
+    while len(_remote_audio_cache) > REMOTE_AUDIO_CACHE_SIZE:
+        _remote_audio_cache.popitem(last=False)
 
 
 def _get_foreign_field_key(deck: dict) -> Optional[str]:
-    for field in deck.get("field_schema", []):
+    schema = deck.get("field_schema") or []
+    required_key = None
+    for field in schema:
         if field.get("key") == "foreign_phrase":
             return field["key"]
-    for field in deck.get("field_schema", []):
-        if field.get("required"):
-            return field["key"]
-    schema = deck.get("field_schema") or []
+        if required_key is None and field.get("required"):
+            required_key = field["key"]
+    if required_key is not None:
+        return required_key
     if schema:
         return schema[0]["key"]
     return None
@@ -278,7 +417,7 @@ def _merge_audio_preferences(
     if not preferences:
         return defaults
     voice = (preferences.voice or "random").lower()
-    if voice not in AUDIO_VOICES:
+    if voice not in AUDIO_VOICE_SET:
         voice = "random"
     instructions = (preferences.instructions or "").strip()
     if not instructions:
@@ -287,14 +426,10 @@ def _merge_audio_preferences(
 
 
 def _normalize_payload(deck: dict, payload: Dict[str, str]) -> Dict[str, str]:
-    normalized: Dict[str, str] = {}
-    for field in deck.get("field_schema", []):
-        value = payload.get(field["key"], "")
-        if isinstance(value, str):
-            normalized[field["key"]] = value.strip()
-        else:
-            normalized[field["key"]] = value
-    return normalized
+    return {
+        field["key"]: payload.get(field["key"], "")
+        for field in deck.get("field_schema", [])
+    }
 
 
 def _normalize_directions(
@@ -320,34 +455,85 @@ def _require_generation(client, generation_allowed: bool):
         )
 
 
+def _load_action_settings(
+    request: CardActionRequest, deck: dict, user_id: uuid.UUID
+) -> tuple:
+    # Deck defaults (on a settings cache miss) and the user's API key both come
+    # from Postgres, so the async action handler resolves them in one thread hop.
+    audio_preferences = _merge_audio_preferences(request.audio_preferences, deck)
+    audio_allowed = deck_service.is_audio_enabled(deck)
+    generation_allowed = api_key_service.user_can_generate(user_id)
+    client = (
+        api_key_service.get_openai_client_for_user(user_id)
+        if generation_allowed
+        else None
+    )
+    generation_prompts = deck_service.get_generation_prompts(deck)
+    return (
+        audio_preferences,
+        audio_allowed,
+        generation_allowed,
+        client,
+        generation_prompts,
+    )
+
+
 async def _handle_action(
     request: CardActionRequest,
     user: dict,
 ) -> dict:
     deck_uuid = parse_uuid(request.deck_id, entity="Deck")
-    deck = deck_service.get_deck(deck_uuid, user["id"])
+    deck = await run_in_threadpool(deck_service.get_deck, deck_uuid, user["id"])
     if not deck:
         raise HTTPException(status_code=404, detail="Deck not found.")
 
     group = None
+    group_uuid = None
     if request.mode == "edit":
         if not request.group_id:
             raise HTTPException(status_code=400, detail="Missing card group id.")
         group_uuid = parse_uuid(request.group_id, entity="Card")
-        group = card_service.get_card_group(user["id"], group_uuid)
+        # The stored clip is only needed when the client did not echo it back.
+        group = await run_in_threadpool(
+            card_service.get_card_group,
+            user["id"],
+            group_uuid,
+            include_audio=not request.audio_preview,
+        )
         if not group:
             raise HTTPException(status_code=404, detail="Card not found.")
 
     payload = _normalize_payload(deck, request.payload)
     directions = _normalize_directions(request, group)
-    audio_preview_b64 = request.audio_preview or ""
-    audio_bytes = _decode_audio_preview(audio_preview_b64)
-    if audio_bytes is None and group and group.get("audio"):
+    audio_preview_b64: Optional[str] = request.audio_preview or ""
+    # A preview sent by the client is only decoded by the save action below.
+    audio_bytes: Optional[bytes] = None
+    if not audio_preview_b64 and group and group.get("audio"):
         audio_bytes = group["audio"]
-        audio_preview_b64 = _encode_audio_preview(audio_bytes)
-    audio_preferences = _merge_audio_preferences(request.audio_preferences, deck)
-    audio_allowed = deck_service.is_audio_enabled(deck)
-    audio_url = (request.audio_url or "").strip()
+        audio_preview_b64 = None
+
+    def current_audio_preview() -> str:
+        # Stored audio is only base64-encoded when a response carries it.
+        nonlocal audio_preview_b64
+        if audio_preview_b64 is None:
+            audio_preview_b64 = _encode_audio_preview(audio_bytes)
+        return audio_preview_b64
+
+    def audio_preview_update() -> dict:
+        # The client keeps its current preview when the key is absent, so
+        # don't echo back a multi-megabyte clip it sent us unchanged.
+        if request.audio_preview and audio_preview_b64 == request.audio_preview:
+            return {}
+        return {"audioPreview": current_audio_preview()}
+
+    (
+        audio_preferences,
+        audio_allowed,
+        generation_allowed,
+        client,
+        generation_prompts,
+    ) = await run_in_threadpool(_load_action_settings, request, deck, user["id"])
+    audio_url = request.audio_url or ""
 
     foreign_field_key = _get_foreign_field_key(deck)
     if not foreign_field_key:
@@ -374,13 +560,8 @@ async def _handle_action(
     user_text_model: Optional[str] = user.get("text_model") or None
     user_audio_model: Optional[str] = user.get("audio_model") or None
 
-    generation_allowed = api_key_service.user_can_generate(user["id"])
-    client = (
-        api_key_service.get_openai_client_for_user(user["id"])
-        if generation_allowed
-        else None
-    )
-    generation_prompts = deck_service.get_generation_prompts(deck)
+    # Speech is awaited directly on the loop rather than parked in a thread.
+    audio_client = api_key_service.async_client_like(client) if client else None
     native_language = user.get("native_language") or "English"
 
     def ensure_input_phrase():
@@ -389,7 +570,7 @@ async def _handle_action(
             return
         raise HTTPException(status_code=400, detail=f"Enter a {seed_label} first.")
 
-    def ensure_foreign_phrase(require_translation: bool = False):
+    async def ensure_foreign_phrase(require_translation: bool = False):
         value = (payload.get(foreign_field_key) or "").strip()
         if value:
             return
@@ -403,21 +584,62 @@ async def _handle_action(
             )
         _require_generation(client, generation_allowed)
         try:
-            payload[foreign_field_key] = (
-                generation_service.generate_foreign_from_native(
-                    client,
-                    generation_prompts,
-                    payload.get(seed_field_key, ""),
-                    native_language,
-                    deck["target_language"],
-                    model=user_text_model,
-                )
+            payload[foreign_field_key] = await run_in_threadpool(
+                generation_service.generate_foreign_from_native,
+                client,
+                generation_prompts,
+                payload.get(seed_field_key, ""),
+                native_language,
+                deck["target_language"],
+                model=user_text_model,
             )
         except Exception as exc:
             raise HTTPException(
                 status_code=500, detail=f"Translation failed: {exc}"
             ) from exc
 
+    async def enrich_with_audio(needs_audio: bool) -> Tuple[dict, Optional[bytes]]:
+        # The foreign phrase is settled by the time this runs and enrichment
+        # never changes it, so the text and speech requests run side by side.
+        tasks = [
+            run_in_threadpool(
+                generation_service.enrich_payload,
+                client,
+                payload,
+                foreign_field_key,
+                deck["target_language"],
+                native_language,
+                generation_prompts,
+                deck.get("field_schema"),
+                model=user_text_model,
+            )
+        ]
+        if needs_audio:
+            tasks.append(
+                generation_service.generate_audio_for_phrase_async(
+                    audio_client,
+                    payload.get(foreign_field_key, ""),
+                    voice=audio_preferences["voice"],
+                    instructions=audio_preferences["instructions"],
+                    audio_model=user_audio_model,
+                )
+            )
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result
+        if isinstance(results[0], Exception):
+            raise HTTPException(
+                status_code=500, detail=f"Generation failed: {results[0]}"
+            ) from results[0]
+        if not needs_audio:
+            return results[0], None
+        if isinstance(results[1], Exception):
+            raise HTTPException(
+                status_code=500, detail=f"Audio generation failed: {results[1]}"
+            ) from results[1]
+        return results[0], results[1]
+
     if request.action == "fetch_audio":
         if not audio_allowed:
             raise HTTPException(
@@ -432,85 +654,48 @@ async def _handle_action(
             "message": "Audio fetched from link. Remember to save when ready.",
             "payload": payload,
             "directions": directions,
-            "audioPreview": audio_preview_b64,
+            **audio_preview_update(),
         }
 
     if request.action == "suggest_tags":
-        ensure_foreign_phrase(require_translation=False)
+        await ensure_foreign_phrase(require_translation=False)
         _require_generation(client, generation_allowed)
-        available_tags = tag_service.list_deck_tags(deck_uuid)
-        suggested = generation_service.infer_tags(
-            client,
-            payload,
-            deck["target_language"],
-            available_tags,
-        )
-        return {
-            "status": "ok",
-            "suggestedTagNames": suggested,
-            "suggestedDifficulty": generation_service.infer_difficulty(client, payload, deck["target_language"]),
-            "payload": payload,
-            "directions": directions,
-            "audioPreview": audio_preview_b64,
-        }
-
-    if request.action not in {"save", "regen_audio", "fetch_audio"}:
-        ensure_foreign_phrase(require_translation=input_mode == "native")
-
-    if request.action == "regen_native_phrase":
-        _require_generation(client, generation_allowed)
-        try:
-            generation_service.regenerate_field(
+        available_tags = await run_in_threadpool(tag_service.list_deck_tags, deck_uuid)
+        suggested, suggested_difficulty = await asyncio.gather(
+            run_in_threadpool(
+                generation_service.infer_tags,
                 client,
-                "native_phrase",
                 payload,
-                foreign_field_key,
                 deck["target_language"],
-                native_language,
-                generation_prompts,
-                deck.get("field_schema"),
-                model=user_text_model,
-            )
-        except Exception as exc:
-            raise HTTPException(status_code=400, detail=str(exc)) from exc
-        return {
-            "status": "ok",
-            "message": "Translation updated.",
-            "payload": payload,
-            "directions": directions,
-            "audioPreview": audio_preview_b64,
-        }
-
-    if request.action == "regen_dictionary_entry":
-        _require_generation(client, generation_allowed)
-        try:
-            generation_service.regenerate_field(
+                available_tags,
+            ),
+            run_in_threadpool(
+                generation_service.infer_difficulty,
                 client,
-                "dictionary_entry",
                 payload,
-                foreign_field_key,
                 deck["target_language"],
-                native_language,
-                generation_prompts,
-                deck.get("field_schema"),
-                model=user_text_model,
-            )
-        except Exception as exc:
-            raise HTTPException(status_code=400, detail=str(exc)) from exc
+            ),
+        )
         return {
             "status": "ok",
-            "message": "Dictionary entry updated.",
+            "suggestedTagNames": suggested,
+            "suggestedDifficulty": suggested_difficulty,
             "payload": payload,
             "directions": directions,
-            "audioPreview": audio_preview_b64,
+            **audio_preview_update(),
         }
 
-    if request.action == "regen_example_sentence":
+    if request.action not in {"save", "regen_audio", "fetch_audio"}:
+        await ensure_foreign_phrase(require_translation=input_mode == "native")
+
+    if request.action in REGEN_FIELD_ACTIONS:
+        field_key, message = REGEN_FIELD_ACTIONS[request.action]
         _require_generation(client, generation_allowed)
         try:
-            generation_service.regenerate_field(
+            await run_in_threadpool(
+                generation_service.regenerate_field,
                 client,
-                "example_sentence",
+                field_key,
                 payload,
                 foreign_field_key,
                 deck["target_language"],
@@ -523,10 +708,10 @@ async def _handle_action(
             raise HTTPException(status_code=400, detail=str(exc)) from exc
         return {
             "status": "ok",
-            "message": "Example sentence updated.",
+            "message": message,
             "payload": payload,
             "directions": directions,
-            "audioPreview": audio_preview_b64,
+            **audio_preview_update(),
         }
 
     if request.action == "regen_audio":
@@ -535,10 +720,10 @@ async def _handle_action(
                 status_code=400, detail="Audio is disabled for this deck."
             )
         _require_generation(client, generation_allowed)
-        ensure_foreign_phrase(require_translation=input_mode == "native")
+        await ensure_foreign_phrase(require_translation=input_mode == "native")
         try:
-            audio_bytes = generation_service.generate_audio_for_phrase(
-                client,
+            audio_bytes = await generation_service.generate_audio_for_phrase_async(
+                audio_client,
                 payload.get(foreign_field_key, ""),
                 voice=audio_preferences["voice"],
                 instructions=audio_preferences["instructions"],
@@ -554,110 +739,75 @@ async def _handle_action(
             "message": "Audio regenerated.",
             "payload": payload,
             "directions": directions,
-            "audioPreview": audio_preview_b64,
+            **audio_preview_update(),
         }
 
     if request.action == "populate_all":
         _require_generation(client, generation_allowed)
-        try:
-            payload = generation_service.enrich_payload(
-                client,
-                payload,
-                foreign_field_key,
-                deck["target_language"],
-                native_language,
-                generation_prompts,
-                deck.get("field_schema"),
-                model=user_text_model,
-            )
-        except Exception as exc:
-            raise HTTPException(
-                status_code=500, detail=f"Generation failed: {exc}"
-            ) from exc
+        payload, generated_audio = await enrich_with_audio(needs_audio=audio_allowed)
         if audio_allowed:
-            try:
-                audio_bytes = generation_service.generate_audio_for_phrase(
-                    client,
-                    payload.get(foreign_field_key, ""),
-                    voice=audio_preferences["voice"],
-                    instructions=audio_preferences["instructions"],
-                    audio_model=user_audio_model,
-                )
-                audio_preview_b64 = _encode_audio_preview(audio_bytes)
-            except Exception as exc:
-                raise HTTPException(
-                    status_code=500, detail=f"Audio generation failed: {exc}"
-                ) from exc
+            audio_bytes = generated_audio
+            audio_preview_b64 = _encode_audio_preview(audio_bytes)
         # Difficulty is always inferred during creation; topic tags remain optional.
-        suggested_difficulty = generation_service.infer_difficulty(
-            client, payload, deck["target_language"]
-        )
-
         # Auto-infer topic tags if deck tag mode is 'auto'
-        suggested_tag_names: List[str] = []
-        if tag_service.get_deck_tag_mode(deck) == "auto":
+        def suggest_tag_names() -> List[str]:
+            if tag_service.get_deck_tag_mode(deck) != "auto":
+                return []
             available_tags = tag_service.list_deck_tags(deck_uuid)
-            suggested_tag_names = generation_service.infer_tags(
+            return generation_service.infer_tags(
                 client, payload, deck["target_language"], available_tags
             )
+
+        # Both read the finished payload and neither raises, so run them together.
+        suggested_difficulty, suggested_tag_names = await asyncio.gather(
+            run_in_threadpool(
+                generation_service.infer_difficulty,
+                client,
+                payload,
+                deck["target_language"],
+            ),
+            run_in_threadpool(suggest_tag_names),
+        )
         return {
             "status": "ok",
             "message": "All fields populated. Review and save when ready.",
             "payload": payload,
             "directions": directions,
-            "audioPreview": audio_preview_b64,
+            **audio_preview_update(),
             "suggestedTagNames": suggested_tag_names,
             "suggestedDifficulty": suggested_difficulty,
         }
 
     if request.action == "save":
-        ensure_foreign_phrase(require_translation=input_mode == "native")
+        await ensure_foreign_phrase(require_translation=input_mode == "native")
         if request.mode == "create" and not directions:
             raise HTTPException(
                 status_code=400, detail="Select at least one direction."
             )
+        if audio_bytes is None and request.audio_preview:
+            audio_bytes = _decode_audio_preview(request.audio_preview)
         auto_generate = generation_allowed and client is not None
 
         if auto_generate:
-            try:
-                payload = generation_service.enrich_payload(
-                    client,
-                    payload,
-                    foreign_field_key,
-                    deck["target_language"],
-                    native_language,
-                    generation_prompts,
-                    deck.get("field_schema"),
-                    model=user_text_model,
-                )
-            except Exception as exc:
-                raise HTTPException(
-                    status_code=500, detail=f"Generation failed: {exc}"
-                ) from exc
-            if audio_allowed and audio_bytes is None:
-                try:
-                    audio_bytes = generation_service.generate_audio_for_phrase(
-                        client,
-                        payload.get(foreign_field_key, ""),
-                        voice=audio_preferences["voice"],
-                        instructions=audio_preferences["instructions"],
-                        audio_model=user_audio_model,
-                    )
-                    audio_preview_b64 = _encode_audio_preview(audio_bytes)
-                except Exception as exc:
-                    raise HTTPException(
-                        status_code=500, detail=f"Audio generation failed: {exc}"
-                    ) from exc
+            needs_audio = audio_allowed and audio_bytes is None
+            payload, generated_audio = await enrich_with_audio(needs_audio=needs_audio)
+            if needs_audio:
+                audio_bytes = generated_audio
+                audio_preview_b64 = _encode_audio_preview(audio_bytes)
 
         difficulty = request.difficulty
         if request.mode == "create" and not difficulty and client:
-            difficulty = generation_service.infer_difficulty(
-                client, payload, deck["target_language"]
+            difficulty = await run_in_threadpool(
+                generation_service.infer_difficulty,
+                client,
+                payload,
+                deck["target_language"],
             )
 
         if request.mode == "create":
             try:
-                group_id = card_service.create_cards(
+                group_id = await run_in_threadpool(
+                    card_service.create_cards,
                     user["id"],
                     deck,
                     payload,
@@ -669,7 +819,7 @@ async def _handle_action(
             except ValueError as exc:
                 raise HTTPException(status_code=400, detail=str(exc)) from exc
             # Save tag assignments
-            _save_card_tags(group_id, request.tag_ids)
+            await run_in_threadpool(_save_card_tags, group_id, request.tag_ids)
             return {
                 "status": "saved",
                 "deckId": str(deck["id"]),
@@ -679,9 +829,10 @@ async def _handle_action(
         if not group:
             raise HTTPException(status_code=404, detail="Card not found.")
         try:
-            success = card_service.update_card_group(
+            success = await run_in_threadpool(
+                card_service.update_card_group,
                 user["id"],
-                parse_uuid(request.group_id, entity="Card"),
+                group_uuid,
                 deck,
                 payload,
                 directions,
@@ -693,8 +844,7 @@ async def _handle_action(
         if not success:
             raise HTTPException(status_code=404, detail="Card not found.")
         # Save tag assignments on edit too
-        group_uuid = parse_uuid(request.group_id, entity="Card")
-        _save_card_tags(group_uuid, request.tag_ids)
+        await run_in_threadpool(_save_card_tags, group_uuid, request.tag_ids)
         return {
             "status": "saved",
             "deckId": str(deck["id"]),
@@ -706,7 +856,9 @@ async def _handle_action(
 
 @router.post("/actions")
 async def card_action(request: CardActionRequest, user=Depends(get_current_user)):
-    return await _handle_action(request, user)
+    # Action results only hold strings and lists, so hand them straight to the
+    # JSON encoder instead of letting jsonable_encoder walk the audio preview.
+    return JSONResponse(await _handle_action(request, user))
 
 
 @router.get("/groups/{group_id}")
@@ -743,27 +895,44 @@ def get_card_group(group_id: str, user=Depends(get_current_user)):
 @router.delete("/groups/{group_id}")
 def delete_card_group(group_id: str, user=Depends(get_current_user)):
     group_uuid = parse_uuid(group_id, entity="Card")
-    group = card_service.get_card_group(user["id"], group_uuid)
-    if not group:
+    deck_id = card_service.delete_card_group(user["id"], group_uuid)
+    if not deck_id:
         raise HTTPException(status_code=404, detail="Card not found.")
-    card_service.delete_card_group(user["id"], group_uuid)
-    return {"status": "ok", "deckId": str(group["deck"]["id"])}
+    return {"status": "ok", "deckId": str(deck_id)}
 
 
 @router.get("/{card_id}/audio")
 def card_audio(
-    card_id: str, side: str = Query("front"), user=Depends(get_current_user)
+    card_id: str,
+    side: str = Query("front"),
+    if_none_match: Optional[str] = Header(None),
+    user=Depends(get_current_user),
 ):
     card_uuid = parse_uuid(card_id, entity="Card")
     if side not in {"front", "back"}:
         side = "front"
+    # The URL stays the same when a card's audio is replaced, so clients must
+    # revalidate; the ETag lets them do that without re-downloading the clip.
+    if if_none_match:
+        digest = card_service.get_card_audio_etag(user["id"], card_uuid, side)
+        if not digest:
+            raise HTTPException(status_code=404, detail="Audio not found.")
+        etag = f'"{digest}"'
+        if etag in {tag.strip() for tag in if_none_match.split(",")}:
+            return Response(
+                status_code=304,
+                headers={"ETag": etag, "Cache-Control": "private, no-cache"},
+            )
     audio = card_service.get_card_audio(user["id"], card_uuid, side)
     if not audio:
         raise HTTPException(status_code=404, detail="Audio not found.")
-    return StreamingResponse(
-        io.BytesIO(audio),
+    return Response(
+        content=audio,
         media_type="audio/mpeg",
-        headers={"Cache-Control": "no-cache"},
+        headers={
+            "ETag": f'"{hashlib.md5(audio).hexdigest()}"',
+            "Cache-Control": "private, no-cache",
+        },
     )
 
 
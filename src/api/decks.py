@@ -1,18 +1,32 @@
-import io
+import hashlib
+import os
+import uuid
 from datetime import datetime
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, File, Form, Query, UploadFile
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    File,
+    Form,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+)
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse, StreamingResponse
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from ..services import cards as card_service
 from ..services import decks as deck_service
 from ..services import exporter as export_service
 from ..services import backups as backup_service
 from ..services import tags as tag_service
-from ..settings import TARGET_LANGUAGE_OPTIONS
-from .dependencies import get_current_user, parse_uuid
+from ..settings import TARGET_LANGUAGE_OPTIONS, TARGET_LANGUAGE_SET
+from .dependencies import get_current_user
+from .responses import FastJSONResponse
 
 router = APIRouter(prefix="/decks")
 
@@ -26,17 +40,17 @@ class DeckField(BaseModel):
     description: Optional[str] = None
     auto_generate: Optional[bool] = Field(None, alias="autoGenerate")
 
-    def to_dict(self) -> dict:
-        return {
-            "key": self.key,
-            "label": self.label,
-            "required": self.required,
-            "description": self.description,
-            "auto_generate": self.auto_generate,
-        }
+    model_config = ConfigDict(populate_by_name=True)
 
-    class Config:
-        allow_population_by_field_name = True
+
+class CardFaceTemplate(BaseModel):
+    front: Optional[str] = None
+    back: Optional[str] = None
+
+
+class CardTemplatesPayload(BaseModel):
+    forward: Optional[CardFaceTemplate] = None
+    backward: Optional[CardFaceTemplate] = None
 
 
 class DeckPayload(BaseModel):
@@ -46,25 +60,12 @@ class DeckPayload(BaseModel):
     audio_instructions: Optional[str] = Field(None, alias="audioInstructions")
     audio_enabled: Optional[bool] = Field(True, alias="audioEnabled")
     generation_prompts: Optional[dict] = Field(None, alias="generationPrompts")
-    card_templates: Optional["CardTemplatesPayload"] = Field(
+    card_templates: Optional[CardTemplatesPayload] = Field(
         None, alias="cardTemplates"
     )
     tag_mode: Optional[str] = Field(None, alias="tagMode")  # 'off'|'manual'|'auto'
 
 
-class CardFaceTemplate(BaseModel):
-    front: Optional[str] = None
-    back: Optional[str] = None
-
-
-class CardTemplatesPayload(BaseModel):
-    forward: Optional[CardFaceTemplate] = None
-    backward: Optional[CardFaceTemplate] = None
-
-    class Config:
-        arbitrary_types_allowed = True
-
-
 def _safe_filename(name: str) -> str:
     """Produce a percent-encoded, header-safe filename slug from a deck name."""
     import re
@@ -80,9 +81,6 @@ def _ensure_native_language(user: dict):
         raise HTTPException(status_code=428, detail="Complete onboarding first.")
 
 
-DeckPayload.model_rebuild()
-
-
 def _card_templates_to_dict(payload: Optional[CardTemplatesPayload]) -> Optional[dict]:
     if not payload:
         return None
@@ -95,62 +93,76 @@ def _build_prompt_templates(
 ) -> Optional[dict]:
     if not generation_overrides and not card_overrides:
         return None
+    # default_prompt_templates() hands back a private copy of the (admin
+    # editable) defaults, so the overrides can be applied to it in place.
     templates = deck_service.default_prompt_templates()
     if generation_overrides:
-        base_generation = templates.get("generation") or {}
-        generation = {key: dict(value) for key, value in base_generation.items()}
+        generation = templates.setdefault("generation", {})
         for key, value in generation_overrides.items():
             if not isinstance(value, dict):
                 continue
-            existing = generation.get(key, {})
-            updated = dict(existing)
+            updated = generation.setdefault(key, {})
             if "system" in value:
                 updated["system"] = value["system"]
             if "user" in value:
                 updated["user"] = value["user"]
-            generation[key] = updated
-        templates["generation"] = generation
     if card_overrides:
         for direction in ("forward", "backward"):
             override = card_overrides.get(direction)
             if not isinstance(override, dict):
                 continue
-            current = dict(templates.get(direction) or {})
+            current = templates.setdefault(direction, {})
             if "front" in override and override["front"] is not None:
                 current["front"] = override["front"]
             if "back" in override and override["back"] is not None:
                 current["back"] = override["back"]
-            templates[direction] = current
     return templates
 
 
+def _etag_json_response(request: Request, content: dict) -> Response:
+    """Serialize once and answer a matching If-None-Match with 304."""
+    response = FastJSONResponse(content)
+    etag = f'"{hashlib.sha1(response.body).hexdigest()}"'
+    # The tag hashes the exact body, so any change (admin defaults, tag renames,
+    # the reader's language) yields a new one; clients revalidate every time.
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if_none_match = request.headers.get("If-None-Match") or ""
+    if etag in {tag.strip() for tag in if_none_match.split(",")}:
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return response
+
+
 @router.get("/options")
-def deck_options(user=Depends(get_current_user)):
-    return {
-        "fieldLibrary": deck_service.get_field_library(),
-        "defaultFieldSchema": deck_service.default_field_schema(),
-        "audioInstructionsTemplate": deck_service.default_audio_instructions_template(),
-        "defaultCardTemplates": deck_service.default_card_templates(),
-        "defaultGenerationPrompts": deck_service.default_generation_prompts(),
-        "targetLanguageOptions": TARGET_LANGUAGE_OPTIONS,
-    }
+def deck_options(request: Request, user=Depends(get_current_user)):
+    return _etag_json_response(
+        request,
+        {
+            "fieldLibrary": deck_service.get_field_library(),
+            "defaultFieldSchema": deck_service.default_field_schema(),
+            "audioInstructionsTemplate": deck_service.default_audio_instructions_template(),
+            "defaultCardTemplates": deck_service.default_card_templates(),
+            "defaultGenerationPrompts": deck_service.default_generation_prompts(),
+            "targetLanguageOptions": TARGET_LANGUAGE_OPTIONS,
+        },
+    )
 
 
 @router.get("")
 def list_decks(user=Depends(get_current_user)):
     decks = deck_service.list_decks(user["id"])
-    return {"decks": decks}
+    return FastJSONResponse({"decks": decks})
 
 
 @router.post("")
 def create_deck(payload: DeckPayload, user=Depends(get_current_user)):
     _ensure_native_language(user)
     target_language = payload.target_language.strip()
-    if target_language not in TARGET_LANGUAGE_OPTIONS:
+    if target_language not in TARGET_LANGUAGE_SET:
         raise HTTPException(status_code=400, detail="Unsupported target language.")
     field_schema = None
     if payload.field_schema:
-        field_schema = [field.to_dict() for field in payload.field_schema]
+        field_schema = [field.model_dump() for field in payload.field_schema]
     generation_overrides = payload.generation_prompts
     card_overrides = _card_templates_to_dict(payload.card_templates)
     prompt_templates = _build_prompt_templates(generation_overrides, card_overrides)
@@ -166,11 +178,10 @@ def create_deck(payload: DeckPayload, user=Depends(get_current_user)):
     return {"deck": deck}
 
 
-@router.get("/{deck_id}")
-def deck_detail(deck_id: str, user=Depends(get_current_user)):
+@router.get("/{deck_id:uuid}")
+def deck_detail(deck_id: uuid.UUID, request: Request, user=Depends(get_current_user)):
     _ensure_native_language(user)
-    deck_uuid = parse_uuid(deck_id, entity="Deck")
-    deck = deck_service.get_deck(deck_uuid, user["id"])
+    deck = deck_service.get_deck(deck_id, user["id"])
     if not deck:
         raise HTTPException(status_code=404, detail="Deck not found.")
     # Limit cards for summary view
@@ -182,8 +193,8 @@ def deck_detail(deck_id: str, user=Depends(get_current_user)):
     # We still want total metrics
     entry_count = paginated["total"]
 
-    # Get total count of individual card faces
-    card_count = card_service.count_cards_in_deck(user["id"], deck["id"])
+    # Card faces are counted by the same query as the entries.
+    card_count = paginated["card_total"]
 
     last_modified = deck.get("updated_at")
     # We can use the latest updated_at from the top 5 cards as a proxy if deeper validtion is needed,
@@ -195,20 +206,23 @@ def deck_detail(deck_id: str, user=Depends(get_current_user)):
         ):
             last_modified = latest_card_update
 
-    return {
-        "deck": deck,
-        "cards": paginated["cards"],
-        "generationPrompts": generation_prompts,
-        "entryCount": entry_count,
-        "cardCount": card_count,
-        "lastModified": last_modified,
-        "tagMode": deck.get("tag_mode", "off"),
-    }
+    return _etag_json_response(
+        request,
+        {
+            "deck": deck,
+            "cards": paginated["cards"],
+            "generationPrompts": generation_prompts,
+            "entryCount": entry_count,
+            "cardCount": card_count,
+            "lastModified": last_modified,
+            "tagMode": deck.get("tag_mode", "off"),
+        },
+    )
 
 
-@router.get("/{deck_id}/cards")
+@router.get("/{deck_id:uuid}/cards")
 def list_deck_cards(
-    deck_id: str,
+    deck_id: uuid.UUID,
     page: int = Query(1, ge=1),
     limit: int = Query(50, ge=1, le=200),
     q: Optional[str] = Query(None, max_length=200),
@@ -216,8 +230,7 @@ def list_deck_cards(
     difficulties: Optional[List[str]] = Query(None),
     user=Depends(get_current_user),
 ):
-    deck_uuid = parse_uuid(deck_id, entity="Deck")
-    deck = deck_service.get_deck(deck_uuid, user["id"])
+    deck = deck_service.get_deck(deck_id, user["id"])
     if not deck:
         raise HTTPException(status_code=404, detail="Deck not found.")
 
@@ -232,26 +245,27 @@ def list_deck_cards(
         difficulties=difficulties or [],
     )
     # Also return the deck's tag definitions so the UI can render filter chips
-    deck_tags = tag_service.list_deck_tags(deck_uuid)
+    deck_tags = tag_service.list_deck_tags(deck_id)
     result["deckTags"] = deck_tags
     result["tagMode"] = deck.get("tag_mode", "off")
 
     result["isFiltered"] = bool(tags or difficulties or q)
-    return result
+    return FastJSONResponse(result)
 
 
-@router.put("/{deck_id}")
-def update_deck(deck_id: str, payload: DeckPayload, user=Depends(get_current_user)):
-    deck_uuid = parse_uuid(deck_id, entity="Deck")
+@router.put("/{deck_id:uuid}")
+def update_deck(
+    deck_id: uuid.UUID, payload: DeckPayload, user=Depends(get_current_user)
+):
     target_language = payload.target_language.strip()
-    if target_language not in TARGET_LANGUAGE_OPTIONS:
+    if target_language not in TARGET_LANGUAGE_SET:
         raise HTTPException(status_code=400, detail="Unsupported target language.")
     field_schema = None
     if payload.field_schema:
-        field_schema = [field.to_dict() for field in payload.field_schema]
+        field_schema = [field.model_dump() for field in payload.field_schema]
     updated = deck_service.update_deck(
         user["id"],
-        deck_uuid,
+        deck_id,
         name=payload.name.strip(),
         target_language=target_language,
         field_schema=field_schema or deck_service.default_field_schema(),
@@ -268,31 +282,29 @@ def update_deck(deck_id: str, payload: DeckPayload, user=Depends(get_current_use
             raise HTTPException(
                 status_code=400, detail="tagMode must be 'off', 'manual', or 'auto'."
             )
-        deck_service.set_deck_tag_mode(deck_uuid, user["id"], payload.tag_mode)
+        deck_service.set_deck_tag_mode(deck_id, user["id"], payload.tag_mode)
         updated["tag_mode"] = payload.tag_mode
     return {"deck": updated}
 
 
-@router.delete("/{deck_id}")
-def delete_deck(deck_id: str, user=Depends(get_current_user)):
-    deck_uuid = parse_uuid(deck_id, entity="Deck")
-    deleted = deck_service.delete_deck(user["id"], deck_uuid)
+@router.delete("/{deck_id:uuid}")
+def delete_deck(deck_id: uuid.UUID, user=Depends(get_current_user)):
+    deleted = deck_service.delete_deck(user["id"], deck_id)
     if not deleted:
         raise HTTPException(status_code=404, detail="Deck not found.")
     return {"status": "ok"}
 
 
-@router.get("/{deck_id}/export")
+@router.get("/{deck_id:uuid}/export")
 def export_deck(
-    deck_id: str,
+    deck_id: uuid.UUID,
     mode: str = Query("incremental", description="incremental|full"),
     user=Depends(get_current_user),
 ):
     mode = (mode or "").strip().lower()
     if mode not in {"incremental", "full"}:
         raise HTTPException(status_code=400, detail="mode must be 'incremental' or 'full'.")
-    deck_uuid = parse_uuid(deck_id, entity="Deck")
-    deck = deck_service.get_deck(deck_uuid, user["id"])
+    deck = deck_service.get_deck(deck_id, user["id"])
     if not deck:
         raise HTTPException(status_code=404, detail="Deck not found.")
 
@@ -318,17 +330,17 @@ def export_deck(
 
     card_service.assign_anki_due_for_export(
         owner_id=user["id"],
-        deck_id=deck_uuid,
+        deck_id=deck_id,
         cards=cards,
     )
 
     binary = export_service.export_deck(deck, cards)
     card_service.record_anki_export_faces(user["id"], cards)
 
-    deck_service.set_deck_last_exported_at(deck_uuid, user["id"])
+    deck_service.set_deck_last_exported_at(deck_id, user["id"])
     filename_slug = _safe_filename(deck["name"])
-    return StreamingResponse(
-        io.BytesIO(binary),
+    return Response(
+        content=binary,
         media_type="application/vnd.anki",
         headers={
             "Content-Disposition": f"attachment; filename*=UTF-8''{filename_slug}.apkg"
@@ -336,17 +348,17 @@ def export_deck(
     )
 
 
-@router.get("/{deck_id}/backup")
-def backup_deck(deck_id: str, user=Depends(get_current_user)):
-    deck_uuid = parse_uuid(deck_id, entity="Deck")
-    deck = deck_service.get_deck(deck_uuid, user["id"])
+@router.get("/{deck_id:uuid}/backup")
+def backup_deck(deck_id: uuid.UUID, user=Depends(get_current_user)):
+    deck = deck_service.get_deck(deck_id, user["id"])
     if not deck:
         raise HTTPException(status_code=404, detail="Deck not found.")
-    cards = card_service.get_cards_for_backup(user["id"], deck_uuid)
-    archive = backup_service.create_backup_archive(deck, cards)
+    cards = card_service.iter_cards_for_backup(user["id"], deck_id)
     filename_slug = _safe_filename(deck["name"])
+    # The archive is zipped while it is sent, so memory stays at about one
+    # card's audio instead of the whole deck.
     return StreamingResponse(
-        io.BytesIO(archive),
+        backup_service.iter_backup_archive(deck, cards),
         media_type="application/zip",
         headers={
             "Content-Disposition": f"attachment; filename*=UTF-8''{filename_slug}.awdeck"
@@ -354,24 +366,28 @@ def backup_deck(deck_id: str, user=Depends(get_current_user)):
     )
 
 
-@router.post("/{deck_id}/import-anki")
+@router.post("/{deck_id:uuid}/import-anki")
 async def import_anki_deck(
-    deck_id: str,
+    deck_id: uuid.UUID,
     file: UploadFile = File(...),
     user=Depends(get_current_user),
 ):
-    deck_uuid = parse_uuid(deck_id, entity="Deck")
-    deck = deck_service.get_deck(deck_uuid, user["id"])
+    deck = await run_in_threadpool(deck_service.get_deck, deck_id, user["id"])
     if not deck:
         raise HTTPException(status_code=404, detail="Deck not found.")
     contents = await file.read(MAX_BACKUP_BYTES + 1)
     if len(contents) > MAX_BACKUP_BYTES:
         raise HTTPException(status_code=413, detail="Anki file is too large (limit: 50 MB).")
-    cards = card_service.get_cards_for_export(
-        user["id"], deck, user.get("native_language")
+    cards = await run_in_threadpool(
+        card_service.get_cards_for_export,
+        user["id"],
+        deck,
+        user.get("native_language"),
     )
     try:
-        return card_service.import_anki_package(user["id"], cards, contents)
+        return await run_in_threadpool(
+            card_service.import_anki_package, user["id"], cards, contents
+        )
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
@@ -382,13 +398,19 @@ async def import_deck(
     policy: Optional[str] = Form(None),
     user=Depends(get_current_user),
 ):
-    contents = await file.read(MAX_BACKUP_BYTES + 1)
-    if len(contents) > MAX_BACKUP_BYTES:
+    # The upload is already spooled to a temp file; let zipfile read members
+    # from it directly instead of copying the whole archive into memory.
+    upload = file.file
+    size = upload.seek(0, os.SEEK_END)
+    upload.seek(0)
+    if size > MAX_BACKUP_BYTES:
         raise HTTPException(
             status_code=413, detail="Backup file is too large (limit: 50 MB)."
         )
     try:
-        deck = backup_service.import_backup(user["id"], contents, policy=policy)
+        deck = await run_in_threadpool(
+            backup_service.import_backup, user["id"], upload, policy=policy
+        )
     except backup_service.DeckImportConflict as conflict:
         return JSONResponse(status_code=409, content=conflict.payload)
     except ValueError as exc:
@@ -29,6 +29,8 @@ def require_admin(user=Depends(get_current_user)):
 
 
 def parse_uuid(value: str, *, entity: str) -> uuid.UUID:
+    if isinstance(value, uuid.UUID):
+        return value
     try:
         return uuid.UUID(str(value))
     except ValueError as exc:
@@ -1,7 +1,9 @@
+import asyncio
 import uuid
 from typing import Dict, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field, field_validator
 
 from ..services import api_keys as api_key_service
@@ -17,6 +19,7 @@ router = APIRouter(prefix="/generate")
 MAX_CARDS_PER_CELL = 10
 MAX_CELLS = 30  # hard cap: exclusive_tag_count ≤ 30
 MAX_TOTAL_CARDS = 50  # hard cap across all cells
+SAVE_AUDIO_CONCURRENCY = 8  # parallel TTS requests per save
 
 
 # ---------------------------------------------------------------------------
@@ -131,24 +134,23 @@ def preview(body: PreviewRequest, user=Depends(get_current_user)):
 
     schema = deck.get("field_schema") or []
 
-    for difficulty, cell_tags in cells:
+    cell_results = bulk_gen.generate_cells(
+        client,
+        cells,
+        card_type=body.card_type,
+        target_language=target_language,
+        native_language=native_language,
+        description=body.description,
+        count=body.cards_per_cell,
+        field_schema=schema,
+        model=model,
+    )
+    for (difficulty, cell_tags), raw in zip(cells, cell_results):
         cell_label = (
             " + ".join(t["name"] for t in cell_tags) if cell_tags else "unconstrained"
         )
         if difficulty:
             cell_label = f"{difficulty} + {cell_label}"
-        raw = bulk_gen.generate_cell(
-            client,
-            card_type=body.card_type,
-            target_language=target_language,
-            native_language=native_language,
-            description=body.description,
-            constraint_tags=cell_tags,
-            difficulty=difficulty,
-            count=body.cards_per_cell,
-            field_schema=schema,
-            model=model,
-        )
         # Add ephemeral ID and cell metadata
         for item in raw:
             item["ephemeral_id"] = str(uuid.uuid4())
@@ -219,27 +221,21 @@ def preview(body: PreviewRequest, user=Depends(get_current_user)):
 
 
 @router.post("/save")
-def save(body: SaveRequest, user=Depends(get_current_user)):
+async def save(body: SaveRequest, user=Depends(get_current_user)):
     deck_uuid = parse_uuid(body.deck_id, entity="Deck")
-    deck = deck_service.get_deck(deck_uuid, user["id"])
+    deck = await run_in_threadpool(deck_service.get_deck, deck_uuid, user["id"])
     if not deck:
         raise HTTPException(status_code=404, detail="Deck not found.")
 
-    native_language = user.get("native_language") or "English"
     directions = [d for d in body.directions if d in ("forward", "backward")]
     if not directions:
         raise HTTPException(status_code=400, detail="Select at least one direction.")
 
     # Audio setup — generate for each accepted card at save time
-    audio_allowed = deck_service.is_audio_enabled(deck)
-    audio_client = None
-    audio_instructions = deck_service.get_audio_instructions(deck) or ""
     audio_model = user.get("audio_model") or None
-    if audio_allowed and api_key_service.user_can_generate(user["id"]):
-        try:
-            audio_client = api_key_service.get_openai_client_for_user(user["id"])
-        except Exception:
-            audio_allowed = False
+    audio_allowed, audio_client, audio_instructions = await run_in_threadpool(
+        _resolve_save_audio, deck, user["id"]
+    )
 
     # Resolve foreign phrase key from field schema
     foreign_field_key = "foreign_phrase"
@@ -248,53 +244,63 @@ def save(body: SaveRequest, user=Depends(get_current_user)):
             foreign_field_key = field["key"]
             break
 
-    saved = 0
-    group_ids: List[str] = []
+    payloads = [dict(card.payload) for card in body.cards]
+    audio_slots = asyncio.Semaphore(SAVE_AUDIO_CONCURRENCY)
+
+    async def card_audio(payload: dict) -> Optional[bytes]:
+        phrase = payload.get(foreign_field_key, "").strip()
+        if not phrase:
+            return None
+        async with audio_slots:
+            try:
+                return await generation_service.generate_audio_for_phrase_async(
+                    audio_client,
+                    phrase,
+                    voice="random",
+                    instructions=audio_instructions,
+                    audio_model=audio_model,
+                )
+            except Exception:
+                return None  # non-critical
+
+    # Speech requests overlap instead of running one card at a time.
+    if audio_allowed and audio_client:
+        audio = await asyncio.gather(*(card_audio(payload) for payload in payloads))
+    else:
+        audio = [None] * len(payloads)
+
+    entries: List[dict] = [
+        {
+            "payload": payload,
+            "audio_bytes": audio_bytes,
+            "difficulty": card.difficulty,
+        }
+        for card, payload, audio_bytes in zip(body.cards, payloads, audio)
+    ]
+
+    # All accepted cards go in with one COPY; invalid ones come back as None.
+    created = await run_in_threadpool(
+        card_service.create_card_groups, user["id"], deck, entries, directions
+    )
 
-    for card in body.cards:
-        try:
-            payload = dict(card.payload)
-
-            # Generate audio for this card's foreign phrase
-            audio_bytes = None
-            if audio_allowed and audio_client:
-                phrase = payload.get(foreign_field_key, "").strip()
-                if phrase:
-                    try:
-                        audio_bytes = generation_service.generate_audio_for_phrase(
-                            audio_client,
-                            phrase,
-                            voice="random",
-                            instructions=audio_instructions,
-                            audio_model=audio_model,
-                        )
-                    except Exception:
-                        pass  # non-critical
-
-            group_id = card_service.create_cards(
-                user["id"],
-                deck,
-                payload,
-                directions,
-                native_language,
-                audio_bytes=audio_bytes,
-                difficulty=card.difficulty,
-            )
-            group_ids.append(str(group_id))
-
-            # Save tag assignments
-            if card.tag_ids:
-                valid_uuids = []
-                for tid in card.tag_ids:
-                    try:
-                        valid_uuids.append(uuid.UUID(tid))
-                    except ValueError:
-                        pass
-                if valid_uuids:
-                    tag_service.set_card_group_tags(group_id, valid_uuids)
-            saved += 1
-        except Exception:
-            pass  # skip invalid cards, save what we can
+    group_ids: List[str] = []
+    tag_assignments: Dict[uuid.UUID, List[uuid.UUID]] = {}
+    for card, group_id in zip(body.cards, created):
+        if group_id is None:
+            continue  # skip invalid cards, save what we can
+        group_ids.append(str(group_id))
+        valid_uuids = []
+        for tid in card.tag_ids:
+            try:
+                valid_uuids.append(uuid.UUID(tid))
+            except ValueError:
+                pass
+        if valid_uuids:
+            tag_assignments[group_id] = valid_uuids
+    await run_in_threadpool(
+        tag_service.add_tags_to_card_groups, deck_uuid, tag_assignments
+    )
+    saved = len(group_ids)
 
     return {"saved": saved, "groupIds": group_ids}
 
@@ -304,6 +310,21 @@ def save(body: SaveRequest, user=Depends(get_current_user)):
 # ---------------------------------------------------------------------------
 
 
+def _resolve_save_audio(deck: dict, user_id: uuid.UUID) -> tuple:
+    # Deck defaults and the user's key are read from Postgres; keep that off the loop.
+    audio_allowed = deck_service.is_audio_enabled(deck)
+    audio_client = None
+    audio_instructions = deck_service.get_audio_instructions(deck) or ""
+    if audio_allowed and api_key_service.user_can_generate(user_id):
+        try:
+            audio_client = api_key_service.async_client_like(
+                api_key_service.get_openai_client_for_user(user_id)
+            )
+        except Exception:
+            audio_allowed = False
+    return audio_allowed, audio_client, audio_instructions
+
+
 def _build_constraint_cells(
     difficulties: List[str], constraints: Dict[str, List[str]], tag_by_id: Dict[str, dict]
 ) -> List[tuple[Optional[str], List[Dict]]]:
@@ -7,7 +7,7 @@ from pydantic import BaseModel, Field
 from ..services import api_keys as api_key_service
 from ..services import models as model_service
 from ..services import users as user_service
-from ..settings import NATIVE_LANGUAGE_OPTIONS
+from ..settings import NATIVE_LANGUAGE_OPTIONS, NATIVE_LANGUAGE_SET
 from .dependencies import get_current_user, parse_uuid
 from .session import _build_logout_url
 
@@ -43,18 +43,17 @@ class ModelTestPayload(BaseModel):
 
 @router.get("")
 def profile_detail(user=Depends(get_current_user)):
-    fresh_user = user_service.get_user(user["id"]) or user
     emails = user_service.list_user_emails(user["id"])
     return {
         "user": {
-            "id": str(fresh_user["id"]),
-            "nativeLanguage": fresh_user.get("native_language"),
-            "primaryEmail": fresh_user.get("primary_email"),
-            "isAdmin": bool(fresh_user.get("is_admin")),
-            "textModel": fresh_user.get("text_model"),
-            "audioModel": fresh_user.get("audio_model"),
-            "theme": fresh_user.get("theme") or "system",
-            "modelsLocked": bool(fresh_user.get("models_locked")),
+            "id": str(user["id"]),
+            "nativeLanguage": user.get("native_language"),
+            "primaryEmail": user.get("primary_email"),
+            "isAdmin": bool(user.get("is_admin")),
+            "textModel": user.get("text_model"),
+            "audioModel": user.get("audio_model"),
+            "theme": user.get("theme") or "system",
+            "modelsLocked": bool(user.get("models_locked")),
         },
         "emails": emails,
         "apiKey": api_key_service.get_api_key_summary(user["id"]),
@@ -84,15 +83,14 @@ def update_native_language(
     language = payload.native_language.strip()
     if not language:
         raise HTTPException(status_code=400, detail="Language cannot be empty.")
-    if language not in NATIVE_LANGUAGE_OPTIONS:
+    if language not in NATIVE_LANGUAGE_SET:
         raise HTTPException(status_code=400, detail="Unsupported native language.")
     user_service.set_native_language(user["id"], language)
-    fresh = user_service.get_user(user["id"]) or user
     return {
         "status": "ok",
         "user": {
-            "id": str(fresh["id"]),
-            "nativeLanguage": fresh.get("native_language"),
+            "id": str(user["id"]),
+            "nativeLanguage": language,
         },
     }
 
@@ -129,8 +127,7 @@ def set_theme(payload: ThemePayload, user=Depends(get_current_user)):
 
 @router.put("/models")
 def set_model_preferences(payload: ModelPrefsPayload, user=Depends(get_current_user)):
-    fresh = user_service.get_user(user["id"]) or user
-    if fresh.get("models_locked"):
+    if user.get("models_locked"):
         raise HTTPException(
             status_code=403,
             detail="Your model settings are managed by an administrator.",
@@ -146,12 +143,11 @@ def set_model_preferences(payload: ModelPrefsPayload, user=Depends(get_current_u
 @router.post("/emails")
 def add_email(payload: EmailPayload, user=Depends(get_current_user)):
     try:
-        user_service.add_user_email(
+        emails = user_service.add_user_email(
             user["id"], payload.email, make_primary=payload.make_primary
         )
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
-    emails = user_service.list_user_emails(user["id"])
     return {"status": "ok", "emails": emails}
 
 
@@ -159,10 +155,9 @@ def add_email(payload: EmailPayload, user=Depends(get_current_user)):
 def delete_email(email_id: str, user=Depends(get_current_user)):
     email_uuid = parse_uuid(email_id, entity="Email")
     try:
-        user_service.remove_user_email(user["id"], email_uuid)
+        emails = user_service.remove_user_email(user["id"], email_uuid)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
-    emails = user_service.list_user_emails(user["id"])
     return {"status": "ok", "emails": emails}
 
 
@@ -170,10 +165,9 @@ def delete_email(email_id: str, user=Depends(get_current_user)):
 def set_primary_email(email_id: str, user=Depends(get_current_user)):
     email_uuid = parse_uuid(email_id, entity="Email")
     try:
-        user_service.set_primary_email(user["id"], email_uuid)
+        emails = user_service.set_primary_email(user["id"], email_uuid)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
-    emails = user_service.list_user_emails(user["id"])
     return {"status": "ok", "emails": emails}
 
 
@@ -1,6 +1,8 @@
+import asyncio
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
 
 from ..services import api_keys as api_key_service
@@ -9,26 +11,31 @@ from ..services import decks as deck_service
 from ..services import users as user_service
 from ..settings import (
     NATIVE_LANGUAGE_OPTIONS,
+    NATIVE_LANGUAGE_SET,
     TARGET_LANGUAGE_OPTIONS,
 )
 from .dependencies import get_current_user
+from .responses import FastJSONResponse
 
 router = APIRouter(prefix="/session")
 
 
+_LOGOUT_SUFFIX = "/cdn-cgi/access/logout"
+
+
 def _build_logout_url(request: Request) -> str:
-    origin = request.headers.get("Origin")
+    headers = request.headers
+    origin = headers.get("origin")
     if origin:
-        return f"{origin.rstrip('/')}/cdn-cgi/access/logout"
+        return origin.rstrip("/") + _LOGOUT_SUFFIX
 
-    forwarded_host = request.headers.get("X-Forwarded-Host")
-    forwarded_proto = request.headers.get("X-Forwarded-Proto", request.url.scheme)
+    forwarded_host = headers.get("x-forwarded-host")
     if forwarded_host:
-        base = f"{forwarded_proto}://{forwarded_host}"
-        return f"{base.rstrip('/')}/cdn-cgi/access/logout"
+        forwarded_proto = headers.get("x-forwarded-proto") or request.url.scheme
+        return f"{forwarded_proto}://{forwarded_host}".rstrip("/") + _LOGOUT_SUFFIX
 
-    base = f"{request.url.scheme}://{request.url.netloc}"
-    return f"{base}/cdn-cgi/access/logout"
+    url = request.url
+    return f"{url.scheme}://{url.netloc}{_LOGOUT_SUFFIX}"
 
 
 class NativeLanguagePayload(BaseModel):
@@ -37,19 +44,18 @@ class NativeLanguagePayload(BaseModel):
 
 @router.get("")
 def session_info(request: Request, user=Depends(get_current_user)):
-    fresh_user = user_service.get_user(user["id"]) or user
     return {
         "user": {
-            "id": str(fresh_user["id"]),
-            "nativeLanguage": fresh_user.get("native_language"),
-            "primaryEmail": fresh_user.get("primary_email"),
-            "isAdmin": bool(fresh_user.get("is_admin")),
-            "theme": fresh_user.get("theme") or "system",
-            "modelsLocked": bool(fresh_user.get("models_locked")),
+            "id": str(user["id"]),
+            "nativeLanguage": user.get("native_language"),
+            "primaryEmail": user.get("primary_email"),
+            "isAdmin": bool(user.get("is_admin")),
+            "theme": user.get("theme") or "system",
+            "modelsLocked": bool(user.get("models_locked")),
         },
         "logoutUrl": _build_logout_url(request),
         "canGenerate": api_key_service.user_can_generate(user["id"]),
-        "needsOnboarding": not bool(fresh_user.get("native_language")),
+        "needsOnboarding": not bool(user.get("native_language")),
         "nativeLanguageOptions": NATIVE_LANGUAGE_OPTIONS,
         "targetLanguageOptions": TARGET_LANGUAGE_OPTIONS,
     }
@@ -58,32 +64,37 @@ def session_info(request: Request, user=Depends(get_current_user)):
 @router.post("/native-language")
 def set_native_language(payload: NativeLanguagePayload, user=Depends(get_current_user)):
     language = payload.native_language.strip()
-    if language not in NATIVE_LANGUAGE_OPTIONS:
+    if language not in NATIVE_LANGUAGE_SET:
         raise HTTPException(status_code=400, detail="Unsupported native language.")
     user_service.set_native_language(user["id"], language)
-    updated = user_service.get_user(user["id"]) or user
     return {
         "status": "ok",
         "user": {
-            "id": str(updated["id"]),
-            "nativeLanguage": updated.get("native_language"),
-            "primaryEmail": updated.get("primary_email"),
-            "isAdmin": bool(updated.get("is_admin")),
+            "id": str(user["id"]),
+            "nativeLanguage": language,
+            "primaryEmail": user.get("primary_email"),
+            "isAdmin": bool(user.get("is_admin")),
         },
     }
 
 
 @router.get("/overview")
-def dashboard_overview(user=Depends(get_current_user)):
+async def dashboard_overview(user=Depends(get_current_user)):
     requires_onboarding = not bool(user.get("native_language"))
-    recent_decks = deck_service.list_recent_decks(user["id"], limit=6)
-    recent_cards = card_service.list_recent_cards(
-        user["id"],
-        user.get("native_language"),
-        limit=4,
+    # Independent queries on separate pooled connections.
+    recent_decks, recent_cards = await asyncio.gather(
+        run_in_threadpool(deck_service.list_recent_decks, user["id"], limit=6),
+        run_in_threadpool(
+            card_service.list_recent_cards,
+            user["id"],
+            user.get("native_language"),
+            limit=4,
+        ),
+    )
+    return FastJSONResponse(
+        {
+            "requiresOnboarding": requires_onboarding,
+            "recentDecks": recent_decks,
+            "recentEntries": recent_cards,
+        }
     )
-    return {
-        "requiresOnboarding": requires_onboarding,
-        "recentDecks": recent_decks,
-        "recentEntries": recent_cards,
-    }
@@ -1,17 +1,23 @@
 from contextlib import asynccontextmanager
 
+import anyio.to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from .api import router as api_router
-from .db.core import init_db
-from .settings import FRONTEND_ORIGINS
+from .api.cards import close_audio_http_client
+from .db.core import close_pool, init_db
+from .settings import FRONTEND_ORIGINS, THREADPOOL_MAX_WORKERS
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = THREADPOOL_MAX_WORKERS
     init_db()
     yield
+    await close_audio_http_client()
+    close_pool()
 
 
 app = FastAPI(title="Anki Words Builder API", lifespan=lifespan)
@@ -26,7 +32,7 @@ app.add_middleware(
 
 
 @app.get("/health")
-def health():
+async def health():
     return {"status": "ok"}
 
 
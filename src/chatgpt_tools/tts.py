@@ -1,9 +1,7 @@
-import os
 import random
-import tempfile
 from typing import Optional
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 VOICES = [
     "alloy",
@@ -43,29 +41,37 @@ def generate_audio_binary(
     if not spoken_text:
         return None
 
-    selected_voice = _pick_voice(voice)
-    prompt = instructions.strip() or DEFAULT_INSTRUCTIONS
-    audio_model = model or DEFAULT_AUDIO_MODEL
-    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".mp3")
-    temp_path = temp_file.name
-    temp_file.close()
-    audio_bytes: Optional[bytes] = None
-    try:
-        with openai_client.audio.speech.with_streaming_response.create(
-            model=audio_model,
-            voice=selected_voice,
-            input=spoken_text,
-            response_format="mp3",
-            instructions=prompt,
-        ) as response:
-            response.stream_to_file(temp_path)
+    with openai_client.audio.speech.with_streaming_response.create(
+        model=model or DEFAULT_AUDIO_MODEL,
+        voice=_pick_voice(voice),
+        input=spoken_text,
+        response_format="mp3",
+        instructions=instructions.strip() or DEFAULT_INSTRUCTIONS,
+    ) as response:
+        audio_bytes = response.read()
 
-        with open(temp_path, "rb") as mp3_file:
-            audio_bytes = mp3_file.read()
-    finally:
-        try:
-            os.remove(temp_path)
-        except OSError:
-            pass
+    return audio_bytes if audio_bytes else None
+
+
+async def generate_audio_binary_async(
+    openai_client: AsyncOpenAI,
+    text: str,
+    *,
+    voice: str = "random",
+    instructions: str = "",
+    model: Optional[str] = None,
+) -> Optional[bytes]:
+    spoken_text = text.strip()
+    if not spoken_text:
+        return None
+
+    async with openai_client.audio.speech.with_streaming_response.create(
+        model=model or DEFAULT_AUDIO_MODEL,
+        voice=_pick_voice(voice),
+        input=spoken_text,
+        response_format="mp3",
+        instructions=instructions.strip() or DEFAULT_INSTRUCTIONS,
+    ) as response:
+        audio_bytes = await response.read()
 
     return audio_bytes if audio_bytes else None
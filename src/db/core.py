@@ -1,10 +1,17 @@
+import threading
 import uuid
 from contextlib import contextmanager
+from typing import Optional, Set
 
 import psycopg2
+from psycopg2.extensions import connection as PGConnection
 from psycopg2.extras import RealDictCursor
+from psycopg2.pool import PoolError, ThreadedConnectionPool
 
 from ..settings import (
+    DB_POOL_MAX_CONN,
+    DB_POOL_MIN_CONN,
+    DB_POOL_TIMEOUT_SECONDS,
     POSTGRES_DB,
     POSTGRES_HOST,
     POSTGRES_PASSWORD,
@@ -12,20 +19,86 @@ from ..settings import (
     POSTGRES_USER,
 )
 
+INIT_DB_LOCK_ID = 7_340_021
+
+_pool: Optional[ThreadedConnectionPool] = None
+_pool_lock = threading.Lock()
+# ThreadedConnectionPool raises instead of waiting when every connection is
+# checked out; gate checkouts so extra threads queue for a free connection.
+_pool_slots = threading.BoundedSemaphore(DB_POOL_MAX_CONN)
+
+
+class PooledConnection(PGConnection):
+    """Connection that remembers which statements it has already PREPAREd."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared_statements: Set[str] = set()
+
+
+def prepare_statement(cur, name: str, sql: str) -> None:
+    """PREPARE `sql` as `name` once per pooled connection.
+
+    Prepared statements live for the whole session, so pooled connections
+    keep them across requests and skip parse/plan on every later EXECUTE.
+    """
+    prepared = getattr(cur.connection, "prepared_statements", None)
+    if prepared is not None and name in prepared:
+        return
+    cur.execute(f"PREPARE {name} AS {sql}")
+    if prepared is not None:
+        prepared.add(name)
+
+
+def _get_pool() -> ThreadedConnectionPool:
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ThreadedConnectionPool(
+                    DB_POOL_MIN_CONN,
+                    DB_POOL_MAX_CONN,
+                    host=POSTGRES_HOST,
+                    database=POSTGRES_DB,
+                    user=POSTGRES_USER,
+                    password=POSTGRES_PASSWORD,
+                    port=POSTGRES_PORT,
+                    connection_factory=PooledConnection,
+                )
+    return _pool
+
+
+def close_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.closeall()
+            _pool = None
+
 
 @contextmanager
 def get_connection():
-    conn = psycopg2.connect(
-        host=POSTGRES_HOST,
-        database=POSTGRES_DB,
-        user=POSTGRES_USER,
-        password=POSTGRES_PASSWORD,
-        port=POSTGRES_PORT,
-    )
+    pool = _get_pool()
+    if not _pool_slots.acquire(timeout=DB_POOL_TIMEOUT_SECONDS):
+        raise PoolError("Timed out waiting for a free database connection.")
+    try:
+        conn = pool.getconn()
+    except BaseException:
+        _pool_slots.release()
+        raise
     try:
         yield conn
     finally:
-        conn.close()
+        # Hand the connection back clean: drop anything left uncommitted and
+        # discard connections that broke mid-request.
+        broken = bool(conn.closed)
+        if not broken:
+            try:
+                conn.rollback()
+            except psycopg2.Error:
+                broken = True
+        pool.putconn(conn, close=broken)
+        _pool_slots.release()
 
 
 def init_db():
@@ -34,6 +107,9 @@ def init_db():
     """
     with get_connection() as conn:
         with conn.cursor() as cur:
+            # Serialize schema setup when several workers start at once.
+            cur.execute("SELECT pg_advisory_xact_lock(%s)", (INIT_DB_LOCK_ID,))
+
             # Users + emails
             cur.execute(
                 """
@@ -144,6 +220,14 @@ def init_db():
             cur.execute(
                 "ALTER TABLE cards ADD COLUMN IF NOT EXISTS audio_filename TEXT"
             )
+            # MP3 audio does not compress; keep it out of line without the
+            # pglz attempt on every write and decompress step on every read.
+            cur.execute(
+                "ALTER TABLE cards ALTER COLUMN front_audio SET STORAGE EXTERNAL"
+            )
+            cur.execute(
+                "ALTER TABLE cards ALTER COLUMN back_audio SET STORAGE EXTERNAL"
+            )
             cur.execute("ALTER TABLE cards ADD COLUMN IF NOT EXISTS card_group_id UUID")
             cur.execute(
                 "ALTER TABLE cards ADD COLUMN IF NOT EXISTS updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()"
@@ -198,6 +282,18 @@ def init_db():
             cur.execute(
                 "CREATE INDEX IF NOT EXISTS idx_cards_group ON cards (card_group_id)"
             )
+            # Trigram index so the card search (payload::text ILIKE '%q%') can
+            # avoid a sequential scan. Creating the extension needs privileges
+            # the database role may lack; search still works without it.
+            cur.execute("SAVEPOINT cards_payload_trgm")
+            try:
+                cur.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+                cur.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_cards_payload_trgm ON cards USING gin ((payload::text) gin_trgm_ops)"
+                )
+            except psycopg2.Error:
+                cur.execute("ROLLBACK TO SAVEPOINT cards_payload_trgm")
+            cur.execute("RELEASE SAVEPOINT cards_payload_trgm")
 
             # Deck-level tag definitions
             cur.execute(
@@ -233,6 +329,11 @@ def init_db():
             cur.execute(
                 "CREATE INDEX IF NOT EXISTS idx_card_tags_group ON card_tags (card_group_id)"
             )
+            # Tag filters join card_tags on tag_id and deleting a deck tag
+            # cascades by tag_id; the primary key only leads with card_group_id.
+            cur.execute(
+                "CREATE INDEX IF NOT EXISTS idx_card_tags_tag ON card_tags (tag_id, card_group_id)"
+            )
 
             # Tag mode on decks — stored as a JSONB column added to decks
             cur.execute(
@@ -1,12 +1,14 @@
 import logging
 import os
 import uuid
+from functools import lru_cache
 from typing import Optional
 
-from openai import OpenAI
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI
 from psycopg2.extras import RealDictCursor
 
 from ..db.core import get_connection
+from ..settings import OPENAI_MAX_RETRIES
 from ..utils.encryption import decrypt, encrypt
 from . import app_settings as app_settings_service
 
@@ -14,6 +16,14 @@ logger = logging.getLogger(__name__)
 
 SYSTEM_OPENAI_KEY = os.getenv("OPENAI_API_KEY")
 
+# Shared by every per-user OpenAI client so keep-alive connections to the API
+# are reused across requests instead of re-handshaking each time.
+_http_client = DefaultHttpxClient()
+_async_http_client = DefaultAsyncHttpxClient()
+# Clients are keyed by (api key, base URL), so a rotated key or a new base URL
+# simply builds a fresh client.
+CLIENT_CACHE_SIZE = 128
+
 
 def _uuid(value: uuid.UUID) -> str:
     return str(value)
@@ -100,15 +110,39 @@ def user_can_generate(user_id: uuid.UUID) -> bool:
     return bool(get_user_api_key(user_id)) or has_system_api_key()
 
 
-def _make_client(api_key: str) -> OpenAI:
-    """Build an OpenAI client, injecting the admin-configured base URL if set."""
-    base_url = app_settings_service.get_openai_api_base()
-    kwargs: dict = {"api_key": api_key}
+@lru_cache(maxsize=CLIENT_CACHE_SIZE)
+def _cached_client(api_key: str, base_url: Optional[str]) -> OpenAI:
+    kwargs: dict = {
+        "api_key": api_key,
+        "http_client": _http_client,
+        "max_retries": OPENAI_MAX_RETRIES,
+    }
     if base_url:
         kwargs["base_url"] = base_url
     return OpenAI(**kwargs)
 
 
+@lru_cache(maxsize=CLIENT_CACHE_SIZE)
+def _cached_async_client(api_key: str, base_url: str) -> AsyncOpenAI:
+    return AsyncOpenAI(
+        api_key=api_key,
+        base_url=base_url,
+        http_client=_async_http_client,
+        max_retries=OPENAI_MAX_RETRIES,
+    )
+
+
+def _make_client(api_key: str) -> OpenAI:
+    """Build an OpenAI client, injecting the admin-configured base URL if set."""
+    base_url = app_settings_service.get_openai_api_base()
+    return _cached_client(api_key, base_url or None)
+
+
+def async_client_like(client: OpenAI) -> AsyncOpenAI:
+    """Async twin of a per-user client, for calls awaited on the event loop."""
+    return _cached_async_client(client.api_key, str(client.base_url))
+
+
 def get_openai_client_for_user(user_id: uuid.UUID) -> OpenAI:
     user_key = get_user_api_key(user_id)
     if user_key:
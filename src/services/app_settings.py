@@ -3,13 +3,24 @@ System-wide key/value settings stored in the app_settings table.
 All values are stored as JSONB; string values are wrapped in a JSON string.
 """
 
-from typing import Optional
+import time
+from typing import Optional, Tuple
 
 from psycopg2.extras import Json, RealDictCursor
 
 from ..db.core import get_connection
 
+# The base URL is read every time an OpenAI client is built. Cache it briefly;
+# other workers pick up admin changes once the TTL expires.
+API_BASE_CACHE_TTL_SECONDS = 30.0
+_api_base_cache: Optional[Tuple[float, Optional[str]]] = None
+
+
 def get_openai_api_base() -> Optional[str]:
+    global _api_base_cache
+    now = time.monotonic()
+    if _api_base_cache and now - _api_base_cache[0] < API_BASE_CACHE_TTL_SECONDS:
+        return _api_base_cache[1]
     with get_connection() as conn:
         with conn.cursor(cursor_factory=RealDictCursor) as cur:
             cur.execute(
@@ -17,16 +28,18 @@ def get_openai_api_base() -> Optional[str]:
                 ("openai_api_base",),
             )
             row = cur.fetchone()
-    if not row:
-        return None
-    v = row["value"]
-    # Stored as a JSON string — unwrap it
-    if isinstance(v, str):
-        return v or None
-    return None
+    value = None
+    if row:
+        v = row["value"]
+        # Stored as a JSON string — unwrap it
+        if isinstance(v, str):
+            value = v or None
+    _api_base_cache = (now, value)
+    return value
 
 
 def set_openai_api_base(value: Optional[str]) -> None:
+    global _api_base_cache
     stored = (value or "").strip()
     with get_connection() as conn:
         with conn.cursor() as cur:
@@ -41,3 +54,4 @@ def set_openai_api_base(value: Optional[str]) -> None:
                 ("openai_api_base", Json(stored)),
             )
         conn.commit()
+    _api_base_cache = None
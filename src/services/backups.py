@@ -1,10 +1,11 @@
+import hashlib
 import io
 import json
 import uuid
 import zipfile
 from datetime import datetime, timezone
 from enum import Enum
-from typing import List, Optional, Set
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Set, Union
 from uuid import UUID
 
 from . import cards as card_service
@@ -126,19 +127,43 @@ def _sanitize_deck(deck: dict) -> dict:
     }
 
 
-def _audio_path(card_id: str, side: str) -> str:
-    return f"{MEDIA_PREFIX}/{card_id}_{side}.bin"
+def _audio_path(audio: bytes) -> str:
+    return f"{MEDIA_PREFIX}/{hashlib.sha256(audio).hexdigest()}.bin"
 
 
-def create_backup_archive(deck: dict, cards: List[dict]) -> bytes:
-    buffer = io.BytesIO()
+class _ChunkSink(io.RawIOBase):
+    """Write-only, unseekable zip target that hands out what was written."""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> Iterator[bytes]:
+        chunks, self._chunks = self._chunks, []
+        if chunks:
+            yield b"".join(chunks)
+
+
+def iter_backup_archive(deck: dict, cards: Iterable[dict]) -> Iterator[bytes]:
+    """Yield the backup zip as it is written, one card's worth at a time."""
+    sink = _ChunkSink()
     manifest = {
         "version": BACKUP_VERSION,
         "generated_at": datetime.utcnow().replace(tzinfo=timezone.utc).isoformat(),
         "deck": _sanitize_deck(deck),
         "cards": [],
     }
-    with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
+    with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
+        # Audio is stored by content hash; both directions of an entry (and any
+        # repeated clips) share one archive member.
+        written: Set[str] = set()
         for card in cards:
             card_id = str(card["id"])
             entry_uuid = _entry_anki_uuid(card)
@@ -158,24 +183,34 @@ def create_backup_archive(deck: dict, cards: List[dict]) -> bytes:
             }
             front_audio = card.get("front_audio")
             if front_audio:
-                path = _audio_path(card_id, "front")
-                archive.writestr(path, front_audio)
+                path = _audio_path(front_audio)
+                if path not in written:
+                    archive.writestr(path, front_audio)
+                    written.add(path)
                 entry["front_audio_path"] = path
             back_audio = card.get("back_audio")
             if back_audio:
-                path = _audio_path(card_id, "back")
-                archive.writestr(path, back_audio)
+                path = _audio_path(back_audio)
+                if path not in written:
+                    archive.writestr(path, back_audio)
+                    written.add(path)
                 entry["back_audio_path"] = path
             manifest["cards"].append(entry)
-        archive.writestr(MANIFEST_FILENAME, json.dumps(manifest, indent=2))
-    buffer.seek(0)
-    return buffer.getvalue()
+            yield from sink.drain()
+        archive.writestr(
+            MANIFEST_FILENAME, json.dumps(manifest, separators=(",", ":"))
+        )
+    yield from sink.drain()
 
 
-def import_backup(owner_id: UUID, archive_bytes: bytes, policy: Optional[str] = None) -> dict:
+def import_backup(
+    owner_id: UUID, archive_data: Union[bytes, BinaryIO], policy: Optional[str] = None
+) -> dict:
+    """Import a backup from bytes or a seekable binary file (e.g. an upload)."""
     selected_policy = _coerce_policy(policy)
-    buffer = io.BytesIO(archive_bytes)
-    with zipfile.ZipFile(buffer, mode="r") as archive:
+    if isinstance(archive_data, (bytes, bytearray)):
+        archive_data = io.BytesIO(archive_data)
+    with zipfile.ZipFile(archive_data, mode="r") as archive:
         try:
             manifest_data = archive.read(MANIFEST_FILENAME)
         except KeyError as exc:
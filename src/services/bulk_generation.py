@@ -2,20 +2,24 @@
 Bulk card generation service.
 
 Architecture (all optimised to minimise LLM calls):
-  Phase 1 — generate_cell():     1 call per constraint cell → raw candidates
+  Phase 1 — generate_cells():    1 call per constraint cell, run concurrently
   Phase 2 — dedup_candidates():  0 tokens — backend set comparison
   Phase 3 — batch_enrich():      1 call total → dictionary_entry for all cards
   Phase 4 — batch_infer_tags():  1 call total → tags for all cards
 """
 
 import json
-import re
 import unicodedata
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Set
 
 from openai import OpenAI
 
 from ..settings import OPENAI_MODEL
+from .generation import _CODE_FENCE_RE
+
+# Constraint cells are independent prompts; their round trips overlap here.
+_CELL_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="bulk-gen")
 
 
 # ---------------------------------------------------------------------------
@@ -118,7 +122,7 @@ def generate_cell(
         )
         raw = response.choices[0].message.content.strip()
         if raw.startswith("```"):
-            raw = re.sub(r"^```[a-z]*\n?", "", raw).rstrip("`").strip()
+            raw = _CODE_FENCE_RE.sub("", raw).rstrip("`").strip()
         candidates = json.loads(raw)
         if not isinstance(candidates, list):
             return []
@@ -142,6 +146,28 @@ def generate_cell(
         return []
 
 
+def generate_cells(
+    client: OpenAI,
+    cells: List[tuple[Optional[str], List[Dict]]],
+    **kwargs,
+) -> List[List[Dict]]:
+    """
+    Run generate_cell() for every (difficulty, constraint_tags) cell.
+    Requests are issued concurrently; results come back in cell order.
+    """
+    futures = [
+        _CELL_POOL.submit(
+            generate_cell,
+            client,
+            difficulty=difficulty,
+            constraint_tags=constraint_tags,
+            **kwargs,
+        )
+        for difficulty, constraint_tags in cells
+    ]
+    return [future.result() for future in futures]
+
+
 # ---------------------------------------------------------------------------
 # Phase 2 — dedup (zero tokens)
 # ---------------------------------------------------------------------------
@@ -170,10 +196,11 @@ def dedup_candidates(
     existing_phrases is a set of normalised foreign_phrase values from the deck.
     Mutates candidates in-place and returns them.
     """
+    existing_lower = {p.lower() for p in existing_phrases}
     existing_normalised = {_normalise(p) for p in existing_phrases}
     for c in candidates:
         fp = c.get("foreign_phrase", "")
-        exact = fp.lower() in {p.lower() for p in existing_phrases}
+        exact = fp.lower() in existing_lower
         normalised = _normalise(fp) in existing_normalised
         c["is_duplicate"] = exact
         c["is_possible_duplicate"] = normalised and not exact
@@ -227,7 +254,7 @@ def batch_enrich_dictionary(
         )
         raw = response.choices[0].message.content.strip()
         if raw.startswith("```"):
-            raw = re.sub(r"^```[a-z]*\n?", "", raw).rstrip("`").strip()
+            raw = _CODE_FENCE_RE.sub("", raw).rstrip("`").strip()
         entries: Dict[str, str] = json.loads(raw)
         if isinstance(entries, dict):
             for c in candidates:
@@ -331,7 +358,7 @@ def batch_infer_tags(
         )
         raw = response.choices[0].message.content.strip()
         if raw.startswith("```"):
-            raw = re.sub(r"^```[a-z]*\n?", "", raw).rstrip("`").strip()
+            raw = _CODE_FENCE_RE.sub("", raw).rstrip("`").strip()
         tag_map = json.loads(raw)
     except Exception:
         pass  # tag_map stays empty — fall through to prefilled-only
@@ -381,7 +408,7 @@ def batch_infer_difficulties(
         )
         raw = response.choices[0].message.content.strip()
         if raw.startswith("```"):
-            raw = re.sub(r"^```[a-z]*\n?", "", raw).rstrip("`").strip()
+            raw = _CODE_FENCE_RE.sub("", raw).rstrip("`").strip()
         levels = json.loads(raw)
     except Exception:
         levels = {}
@@ -1,17 +1,20 @@
+import base64
+import hashlib
 import io
+import json
 import re
 import sqlite3
 import tempfile
 import uuid
 import zipfile
-from datetime import datetime
-from typing import Dict, Iterable, List, Optional, Tuple
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 from jinja2 import Template
 from psycopg2 import Binary
-from psycopg2.extras import Json, RealDictCursor
+from psycopg2.extras import Json, RealDictCursor, execute_batch, execute_values
 
-from ..db.core import get_connection
+from ..db.core import get_connection, prepare_statement
 from . import decks as deck_service
 from . import tags as tag_service
 
@@ -49,6 +52,15 @@ LEGACY_PROMPT_TEMPLATES = {
 
 DIFFICULTY_LEVELS = ("A1", "A2", "B1", "B2", "C1", "C2")
 
+# Rows per round-trip when streaming cards (with audio blobs) from a named cursor.
+EXPORT_FETCH_SIZE = 200
+# Cards whose audio is loaded per short-lived checkout while a backup streams.
+BACKUP_AUDIO_BATCH_SIZE = 50
+# Rows per multi-VALUES INSERT; kept small because each row may carry audio.
+RESTORE_INSERT_PAGE_SIZE = 100
+# Rows per UPDATE ... FROM (VALUES ...) statement for export bookkeeping.
+EXPORT_UPDATE_PAGE_SIZE = 1000
+
 
 CARD_GUID_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_DNS, "anki-words-builder/card")
 ANKI_SOUND_TAG = re.compile(r"(?:<br\s*/?>)?\s*\[sound:[^\]]+\]", re.IGNORECASE)
@@ -93,6 +105,17 @@ def strip_anki_sound_tags(face: str) -> str:
     return ANKI_SOUND_TAG.sub("", face).rstrip()
 
 
+def _decode_audio(value: Optional[str]) -> Optional[bytes]:
+    # psycopg2 only speaks the text protocol, where BYTEA arrives hex-encoded
+    # (2x the bytes). Audio columns are selected as base64 instead (~1.33x).
+    return base64.b64decode(value) if value else None
+
+
+def audio_filename(audio: bytes) -> str:
+    """Name audio by content so identical clips share one media file."""
+    return f"{hashlib.sha256(audio).hexdigest()[:32]}.mp3"
+
+
 def _validate_payload(payload: dict, field_schema: List[dict]):
     missing = []
     for field in field_schema:
@@ -110,9 +133,14 @@ def _render_face(template_text: str, context: dict) -> str:
 
 
 def _render_card(
-    deck: dict, payload: dict, direction: str, native_language: Optional[str]
+    deck: dict,
+    payload: dict,
+    direction: str,
+    native_language: Optional[str],
+    default_templates: Optional[dict] = None,
 ):
-    default_templates = deck_service.default_prompt_templates()
+    if default_templates is None:
+        default_templates = deck_service.default_prompt_templates()
     templates = deck.get("prompt_templates") or default_templates
     prompt = templates.get(direction) or default_templates.get(direction)
     legacy_candidates = LEGACY_PROMPT_TEMPLATES.get(direction, [])
@@ -148,7 +176,7 @@ def create_cards(
 
     group_id = uuid.uuid4()
     entry_anki_id = generate_entry_anki_id()
-    audio_filename = f"{uuid.uuid4().hex}.mp3" if audio_bytes else None
+    media_filename = audio_filename(audio_bytes) if audio_bytes else None
     with get_connection() as conn:
         with conn.cursor(cursor_factory=RealDictCursor) as cur:
             for direction in valid_directions:
@@ -174,7 +202,7 @@ def create_cards(
                         Json(payload),
                         Binary(front_audio) if front_audio else None,
                         Binary(back_audio) if back_audio else None,
-                        audio_filename,
+                        media_filename,
                         _uuid(card_anki_id),
                         difficulty,
                     ),
@@ -184,6 +212,67 @@ def create_cards(
     return group_id
 
 
+def create_card_groups(
+    owner_id: uuid.UUID,
+    deck: dict,
+    entries: List[dict],
+    directions: Iterable[str],
+) -> List[Optional[uuid.UUID]]:
+    """Create many card groups with a single COPY.
+
+    Each entry holds ``payload`` and optionally ``audio_bytes`` and
+    ``difficulty``. Returns one group id per entry, or None for entries that
+    failed validation and were skipped.
+    """
+    valid_directions = [d for d in directions if d in ("forward", "backward")]
+    if not valid_directions:
+        raise ValueError("Select at least one direction to generate cards.")
+
+    # COPY writes NULL rather than the column default, so stamp rows here.
+    now = datetime.now(timezone.utc)
+    rows: List[tuple] = []
+    group_ids: List[Optional[uuid.UUID]] = []
+    for entry in entries:
+        payload = entry.get("payload") or {}
+        difficulty = entry.get("difficulty")
+        try:
+            _validate_payload(payload, deck.get("field_schema", []))
+        except ValueError:
+            group_ids.append(None)
+            continue
+        if difficulty is not None and difficulty not in DIFFICULTY_LEVELS:
+            group_ids.append(None)
+            continue
+        audio_bytes = entry.get("audio_bytes")
+        group_id = uuid.uuid4()
+        entry_anki_id = generate_entry_anki_id()
+        card = {
+            "payload": payload,
+            "back_audio": audio_bytes,
+            "audio_filename": audio_filename(audio_bytes) if audio_bytes else None,
+            "created_at": now,
+            "difficulty": difficulty,
+        }
+        for direction in valid_directions:
+            rows.append(
+                _entry_card_row(
+                    owner_id,
+                    deck["id"],
+                    group_id,
+                    entry_anki_id,
+                    {**card, "direction": direction},
+                )
+            )
+        group_ids.append(group_id)
+
+    if rows:
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                _copy_card_rows(cur, rows)
+            conn.commit()
+    return group_ids
+
+
 def list_recent_cards(
     owner_id: uuid.UUID, native_language: Optional[str], limit: int = 10
 ) -> List[dict]:
@@ -301,77 +390,6 @@ def list_recent_cards(
     return _attach_tags_to_groups(ordered_groups)
 
 
-def list_cards_for_deck(
-    owner_id: uuid.UUID, deck: dict, native_language: Optional[str]
-) -> List[dict]:
-    with get_connection() as conn:
-        with conn.cursor(cursor_factory=RealDictCursor) as cur:
-            cur.execute(
-                """
-                SELECT c.card_group_id,
-                       c.id,
-                       c.direction,
-                       c.payload,
-                       c.difficulty,
-                       c.anki_front_override,
-                       c.anki_back_override,
-                       c.created_at,
-                       c.updated_at,
-                       c.front_audio IS NOT NULL AS has_front_audio,
-                       c.back_audio IS NOT NULL AS has_back_audio
-                FROM cards c
-                WHERE c.owner_id = %s AND c.deck_id = %s
-                ORDER BY c.card_group_id, c.direction
-                """,
-                (_uuid(owner_id), _uuid(deck["id"])),
-            )
-            rows = cur.fetchall()
-
-    grouped: Dict[str, dict] = {}
-    for row in rows:
-        group_id = row["card_group_id"]
-        group = grouped.setdefault(
-            group_id,
-            {
-                "group_id": group_id,
-                "payload": row["payload"],
-                "difficulty": row.get("difficulty"),
-                "created_at": row["created_at"],
-                "updated_at": row["updated_at"],
-                "directions": [],
-                "audio_card": None,
-                "audio_side": None,
-            },
-        )
-        group["created_at"] = min(group["created_at"], row["created_at"])
-        group["updated_at"] = max(group["updated_at"], row["updated_at"])
-        faces = _render_card(deck, row["payload"], row["direction"], native_language)
-        faces["front"] = row.get("anki_front_override") or faces["front"]
-        faces["back"] = row.get("anki_back_override") or faces["back"]
-        group["directions"].append(
-            {
-                "id": row["id"],
-                "direction": row["direction"],
-                "front": faces["front"],
-                "back": faces["back"],
-                "has_front_audio": row["has_front_audio"],
-                "has_back_audio": row["has_back_audio"],
-            }
-        )
-        if row["has_front_audio"] and not group["audio_card"]:
-            group["audio_card"] = row["id"]
-            group["audio_side"] = "front"
-        elif row["has_back_audio"] and not group["audio_card"]:
-            group["audio_card"] = row["id"]
-            group["audio_side"] = "back"
-    ordered = sorted(
-        grouped.values(),
-        key=lambda g: g["updated_at"],
-        reverse=True,
-    )
-    return _attach_tags_to_groups(list(ordered))
-
-
 def list_cards_for_deck_paginated(
     owner_id: uuid.UUID,
     deck: dict,
@@ -420,12 +438,14 @@ def list_cards_for_deck_paginated(
                     query_params.extend(valid)
 
             count_sql = f"""
-                SELECT COUNT(DISTINCT card_group_id) as total
+                SELECT COUNT(DISTINCT card_group_id) as total,
+                       COUNT(*) as card_total
                 FROM cards
                 WHERE owner_id = %s AND deck_id = %s {search_clause} {tag_clause} {difficulty_clause}
             """
             cur.execute(count_sql, tuple(query_params))
-            total_groups = cur.fetchone()["total"]
+            counts = cur.fetchone()
+            total_groups = counts["total"]
 
             groups_sql = f"""
                 SELECT card_group_id, MAX(updated_at) as max_updated
@@ -442,6 +462,7 @@ def list_cards_for_deck_paginated(
                 return {
                     "cards": [],
                     "total": 0,
+                    "card_total": 0,
                     "page": page,
                     "limit": limit,
                     "pages": 0,
@@ -526,6 +547,7 @@ def list_cards_for_deck_paginated(
     return {
         "cards": ordered_groups,
         "total": total_groups,
+        "card_total": counts["card_total"],
         "page": page,
         "limit": limit,
         "pages": math.ceil(total_groups / limit) if limit > 0 else 1,
@@ -539,8 +561,17 @@ def get_cards_for_export(
     *,
     since: Optional[datetime] = None,
 ) -> List[dict]:
+    export_rows = []
+    # Resolved up front: on a settings cache miss this takes its own pooled
+    # connection, which must not happen while the export cursor holds one.
+    default_templates = deck_service.default_prompt_templates()
     with get_connection() as conn:
-        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+        # Stream rows so raw audio buffers are released batch by batch instead
+        # of holding every blob twice (fetched row plus exported copy).
+        with conn.cursor(
+            name=f"export_{uuid.uuid4().hex}", cursor_factory=RealDictCursor
+        ) as cur:
+            cur.itersize = EXPORT_FETCH_SIZE
             where_since = ""
             params: List[object] = [_uuid(owner_id), _uuid(deck["id"])]
             if since is not None:
@@ -562,8 +593,8 @@ def get_cards_for_export(
                        c.anki_back_override,
                        c.anki_front_exported,
                        c.anki_back_exported,
-                       c.front_audio,
-                       c.back_audio,
+                       encode(c.front_audio, 'base64') AS front_audio,
+                       encode(c.back_audio, 'base64') AS back_audio,
                        c.audio_filename
                 FROM cards c
                 WHERE c.owner_id = %s AND c.deck_id = %s
@@ -572,51 +603,60 @@ def get_cards_for_export(
                 """,
                 tuple(params),
             )
-            rows = cur.fetchall()
-
-    export_rows = []
-    for row in rows:
-        faces = _render_card(deck, row["payload"], row["direction"], native_language)
-        export_rows.append(
-            {
-                **row,
-                "entry_anki_id": row.get("entry_anki_id"),
-                "front": faces["front"],
-                "back": faces["back"],
-                "anki_due": row.get("anki_due"),
-                "difficulty": row.get("difficulty"),
-                "anki_front_override": row.get("anki_front_override"),
-                "anki_back_override": row.get("anki_back_override"),
-                "anki_front_exported": row.get("anki_front_exported"),
-                "anki_back_exported": row.get("anki_back_exported"),
-                "front_audio": bytes(row["front_audio"])
-                if row["front_audio"]
-                else None,
-                "back_audio": bytes(row["back_audio"]) if row["back_audio"] else None,
-                "audio_filename": row.get("audio_filename"),
-                "updated_at": row.get("updated_at"),
-            }
-        )
+            for row in cur:
+                faces = _render_card(
+                    deck,
+                    row["payload"],
+                    row["direction"],
+                    native_language,
+                    default_templates,
+                )
+                export_rows.append(
+                    {
+                        **row,
+                        "entry_anki_id": row.get("entry_anki_id"),
+                        "front": faces["front"],
+                        "back": faces["back"],
+                        "anki_due": row.get("anki_due"),
+                        "difficulty": row.get("difficulty"),
+                        "anki_front_override": row.get("anki_front_override"),
+                        "anki_back_override": row.get("anki_back_override"),
+                        "anki_front_exported": row.get("anki_front_exported"),
+                        "anki_back_exported": row.get("anki_back_exported"),
+                        "front_audio": _decode_audio(row["front_audio"]),
+                        "back_audio": _decode_audio(row["back_audio"]),
+                        "audio_filename": row.get("audio_filename"),
+                        "updated_at": row.get("updated_at"),
+                    }
+                )
     return export_rows
 
 
 def record_anki_export_faces(owner_id: uuid.UUID, cards: List[dict]) -> None:
+    if not cards:
+        return
     with get_connection() as conn:
         with conn.cursor() as cur:
-            for card in cards:
-                cur.execute(
-                    """
-                    UPDATE cards
-                    SET anki_front_exported = %s, anki_back_exported = %s
-                    WHERE id = %s AND owner_id = %s
-                    """,
+            execute_values(
+                cur,
+                """
+                UPDATE cards
+                SET anki_front_exported = v.front, anki_back_exported = v.back
+                FROM (VALUES %s) AS v(id, owner_id, front, back)
+                WHERE cards.id = v.id AND cards.owner_id = v.owner_id
+                """,
+                [
                     (
-                        card.get("_anki_front_exported"),
-                        card.get("_anki_back_exported"),
                         _uuid(card["id"]),
                         _uuid(owner_id),
-                    ),
-                )
+                        card.get("_anki_front_exported"),
+                        card.get("_anki_back_exported"),
+                    )
+                    for card in cards
+                ],
+                template="(%s::uuid, %s::uuid, %s::text, %s::text)",
+                page_size=EXPORT_UPDATE_PAGE_SIZE,
+            )
         conn.commit()
 
 
@@ -653,56 +693,66 @@ def import_anki_package(owner_id: uuid.UUID, cards: List[dict], package: bytes)
 
     matched = 0
     changed = 0
-    with get_connection() as conn:
-        with conn.cursor() as cur:
-            for row in rows:
-                card = by_guid.get(row[0])
-                fields = row[1].split("\x1f")
-                if not card or len(fields) < 2:
-                    continue
-                matched += 1
-                front, back = fields[:2]
-                faces_changed = (
-                    card.get("anki_front_exported") is None
-                    or card.get("anki_back_exported") is None
-                    or front != card.get("anki_front_exported")
-                    or back != card.get("anki_back_exported")
-                )
-                scheduling = {
-                    "modified_at": row[2],
-                    "type": row[3],
-                    "queue": row[4],
-                    "due": row[5],
-                    "interval": row[6],
-                    "ease_factor": row[7],
-                    "repetitions": row[8],
-                    "lapses": row[9],
-                    "left": row[10],
-                    "original_due": row[11],
-                    "original_deck_id": row[12],
-                }
-                cur.execute(
+    updates = []
+    for row in rows:
+        card = by_guid.get(row[0])
+        fields = row[1].split("\x1f")
+        if not card or len(fields) < 2:
+            continue
+        matched += 1
+        front, back = fields[:2]
+        faces_changed = (
+            card.get("anki_front_exported") is None
+            or card.get("anki_back_exported") is None
+            or front != card.get("anki_front_exported")
+            or back != card.get("anki_back_exported")
+        )
+        scheduling = {
+            "modified_at": row[2],
+            "type": row[3],
+            "queue": row[4],
+            "due": row[5],
+            "interval": row[6],
+            "ease_factor": row[7],
+            "repetitions": row[8],
+            "lapses": row[9],
+            "left": row[10],
+            "original_due": row[11],
+            "original_deck_id": row[12],
+        }
+        updates.append(
+            (
+                faces_changed,
+                strip_anki_sound_tags(front),
+                strip_anki_sound_tags(back),
+                Json(scheduling),
+                _uuid(card["id"]),
+                _uuid(owner_id),
+            )
+        )
+        changed += int(faces_changed)
+
+    if updates:
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                prepare_statement(
+                    cur,
+                    "apply_anki_import",
                     """
                     UPDATE cards
-                    SET anki_front_override = CASE WHEN %s THEN %s ELSE anki_front_override END,
-                        anki_back_override = CASE WHEN %s THEN %s ELSE anki_back_override END,
-                        anki_scheduling = %s,
-                        updated_at = CASE WHEN %s THEN NOW() ELSE updated_at END
-                    WHERE id = %s AND owner_id = %s
+                    SET anki_front_override = CASE WHEN $1::boolean THEN $2::text ELSE anki_front_override END,
+                        anki_back_override = CASE WHEN $1::boolean THEN $3::text ELSE anki_back_override END,
+                        anki_scheduling = $4::jsonb,
+                        updated_at = CASE WHEN $1::boolean THEN NOW() ELSE updated_at END
+                    WHERE id = $5::uuid AND owner_id = $6::uuid
                     """,
-                    (
-                        faces_changed,
-                        strip_anki_sound_tags(front),
-                        faces_changed,
-                        strip_anki_sound_tags(back),
-                        Json(scheduling),
-                        faces_changed,
-                        _uuid(card["id"]),
-                        _uuid(owner_id),
-                    ),
                 )
-                changed += int(faces_changed)
-        conn.commit()
+                execute_batch(
+                    cur,
+                    "EXECUTE apply_anki_import (%s, %s, %s, %s, %s, %s)",
+                    updates,
+                )
+            conn.commit()
     return {"matched": matched, "changed": changed}
 
 
@@ -774,15 +824,28 @@ def assign_anki_due_for_export(
                     to_update.append((due, _uuid(card["id"]), _uuid(owner_id)))
                     card["anki_due"] = due
 
-            for due, card_id, o in to_update:
-                cur.execute(
-                    "UPDATE cards SET anki_due = %s WHERE id = %s AND owner_id = %s",
-                    (due, card_id, o),
-                )
+            execute_values(
+                cur,
+                """
+                UPDATE cards
+                SET anki_due = v.due
+                FROM (VALUES %s) AS v(due, id, owner_id)
+                WHERE cards.id = v.id AND cards.owner_id = v.owner_id
+                """,
+                to_update,
+                template="(%s::integer, %s::uuid, %s::uuid)",
+                page_size=EXPORT_UPDATE_PAGE_SIZE,
+            )
         conn.commit()
 
 
-def get_cards_for_backup(owner_id: uuid.UUID, deck_id: uuid.UUID) -> List[dict]:
+def iter_cards_for_backup(owner_id: uuid.UUID, deck_id: uuid.UUID) -> Iterator[dict]:
+    """Load backup rows now and return an iterator that attaches their audio.
+
+    Metadata is read up front so DB errors surface before the response starts.
+    Audio blobs are then fetched in small batches, each on its own brief
+    checkout, so a slow download never pins a pooled connection.
+    """
     with get_connection() as conn:
         with conn.cursor(cursor_factory=RealDictCursor) as cur:
             cur.execute(
@@ -795,8 +858,6 @@ def get_cards_for_backup(owner_id: uuid.UUID, deck_id: uuid.UUID) -> List[dict]:
                        c.difficulty,
                        c.created_at,
                        c.updated_at,
-                       c.front_audio,
-                       c.back_audio,
                        c.audio_filename
                 FROM cards c
                 WHERE c.owner_id = %s AND c.deck_id = %s
@@ -805,10 +866,28 @@ def get_cards_for_backup(owner_id: uuid.UUID, deck_id: uuid.UUID) -> List[dict]:
                 (_uuid(owner_id), _uuid(deck_id)),
             )
             rows = cur.fetchall()
-    cards = []
-    for row in rows:
-        cards.append(
-            {
+    return _attach_backup_audio(owner_id, rows)
+
+
+def _attach_backup_audio(owner_id: uuid.UUID, rows: List[dict]) -> Iterator[dict]:
+    for start in range(0, len(rows), BACKUP_AUDIO_BATCH_SIZE):
+        batch = rows[start : start + BACKUP_AUDIO_BATCH_SIZE]
+        with get_connection() as conn:
+            with conn.cursor(cursor_factory=RealDictCursor) as cur:
+                cur.execute(
+                    """
+                    SELECT c.id,
+                           encode(c.front_audio, 'base64') AS front_audio,
+                           encode(c.back_audio, 'base64') AS back_audio
+                    FROM cards c
+                    WHERE c.owner_id = %s AND c.id = ANY(%s::uuid[])
+                    """,
+                    (_uuid(owner_id), [_uuid(row["id"]) for row in batch]),
+                )
+                audio = {str(row["id"]): row for row in cur.fetchall()}
+        for row in batch:
+            clips = audio.get(str(row["id"])) or {}
+            yield {
                 "id": row["id"],
                 "card_group_id": row["card_group_id"],
                 "entry_anki_id": row.get("entry_anki_id"),
@@ -817,21 +896,27 @@ def get_cards_for_backup(owner_id: uuid.UUID, deck_id: uuid.UUID) -> List[dict]:
                 "difficulty": row.get("difficulty"),
                 "created_at": row["created_at"],
                 "updated_at": row["updated_at"],
-                "front_audio": bytes(row["front_audio"])
-                if row["front_audio"]
-                else None,
-                "back_audio": bytes(row["back_audio"]) if row["back_audio"] else None,
+                "front_audio": _decode_audio(clips.get("front_audio")),
+                "back_audio": _decode_audio(clips.get("back_audio")),
                 "audio_filename": row.get("audio_filename"),
             }
-        )
-    return cards
 
 
-def get_card_group(owner_id: uuid.UUID, group_id: uuid.UUID) -> Optional[dict]:
+def get_card_group(
+    owner_id: uuid.UUID, group_id: uuid.UUID, *, include_audio: bool = True
+) -> Optional[dict]:
+    # Audio blobs dominate the row size; skip them when the caller only needs
+    # the group's metadata.
+    audio_columns = (
+        "encode(c.front_audio, 'base64') AS front_audio,"
+        " encode(c.back_audio, 'base64') AS back_audio"
+        if include_audio
+        else "NULL AS front_audio, NULL AS back_audio"
+    )
     with get_connection() as conn:
         with conn.cursor(cursor_factory=RealDictCursor) as cur:
             cur.execute(
-                """
+                f"""
                 SELECT c.card_group_id,
                        c.id,
                        c.direction,
@@ -841,8 +926,7 @@ def get_card_group(owner_id: uuid.UUID, group_id: uuid.UUID) -> Optional[dict]:
                        c.updated_at,
                        c.deck_id,
                        c.audio_filename,
-                       c.front_audio,
-                       c.back_audio,
+                       {audio_columns},
                        c.anki_front_override,
                        c.anki_back_override,
                        c.anki_scheduling,
@@ -878,10 +962,10 @@ def get_card_group(owner_id: uuid.UUID, group_id: uuid.UUID) -> Optional[dict]:
         created_at = min(created_at, row["created_at"])
         updated_at = max(updated_at, row["updated_at"])
         if row["front_audio"]:
-            audio_bytes = bytes(row["front_audio"])
+            audio_bytes = _decode_audio(row["front_audio"])
             break
         if row["back_audio"]:
-            audio_bytes = bytes(row["back_audio"])
+            audio_bytes = _decode_audio(row["back_audio"])
             break
 
     return {
@@ -931,7 +1015,7 @@ def update_card_group(
 
             existing = {row["direction"]: row for row in rows}
             entry_anki_id = rows[0].get("entry_anki_id") or generate_entry_anki_id()
-            audio_filename = f"{uuid.uuid4().hex}.mp3" if audio_bytes else None
+            media_filename = audio_filename(audio_bytes) if audio_bytes else None
 
             # Upsert desired directions
             for direction in valid_directions:
@@ -951,7 +1035,7 @@ def update_card_group(
                             [
                                 None,
                                 Binary(audio_bytes),
-                                audio_filename,
+                                media_filename,
                             ]
                         )
                     set_clauses.append("updated_at = NOW()")
@@ -962,7 +1046,7 @@ def update_card_group(
                     card_id = uuid.uuid4()
                     card_anki_id = stable_card_uuid(entry_anki_id, direction)
                     back_audio = Binary(audio_bytes) if audio_bytes else None
-                    audio_name = audio_filename if audio_bytes else None
+                    audio_name = media_filename if audio_bytes else None
                     cur.execute(
                         """
                         INSERT INTO cards (
@@ -995,32 +1079,70 @@ def update_card_group(
     return True
 
 
-def delete_card_group(owner_id: uuid.UUID, group_id: uuid.UUID) -> bool:
+def delete_card_group(
+    owner_id: uuid.UUID, group_id: uuid.UUID
+) -> Optional[uuid.UUID]:
+    """Delete every card in the group and return its deck id, if any existed."""
     with get_connection() as conn:
         with conn.cursor() as cur:
             cur.execute(
-                "DELETE FROM cards WHERE owner_id = %s AND card_group_id = %s",
+                """
+                DELETE FROM cards
+                WHERE owner_id = %s AND card_group_id = %s
+                RETURNING deck_id
+                """,
                 (_uuid(owner_id), _uuid(group_id)),
             )
-            deleted = cur.rowcount > 0
+            row = cur.fetchone()
         conn.commit()
-    return deleted
+    return row[0] if row else None
 
 
 def get_card_audio(
     owner_id: uuid.UUID, card_id: uuid.UUID, side: str
 ) -> Optional[bytes]:
     column = "front_audio" if side == "front" else "back_audio"
+    statement = f"get_card_{column}"
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            prepare_statement(
+                cur,
+                statement,
+                f"""
+                SELECT encode({column}, 'base64')
+                FROM cards
+                WHERE owner_id = $1::uuid AND id = $2::uuid
+                """,
+            )
+            cur.execute(
+                f"EXECUTE {statement} (%s, %s)", (_uuid(owner_id), _uuid(card_id))
+            )
+            row = cur.fetchone()
+    return _decode_audio(row[0]) if row else None
+
+
+def get_card_audio_etag(
+    owner_id: uuid.UUID, card_id: uuid.UUID, side: str
+) -> Optional[str]:
+    """md5 of the stored clip, computed in the database so the blob stays there."""
+    column = "front_audio" if side == "front" else "back_audio"
+    statement = f"get_card_{column}_md5"
     with get_connection() as conn:
         with conn.cursor() as cur:
+            prepare_statement(
+                cur,
+                statement,
+                f"""
+                SELECT md5({column})
+                FROM cards
+                WHERE owner_id = $1::uuid AND id = $2::uuid
+                """,
+            )
             cur.execute(
-                f"SELECT {column} FROM cards WHERE owner_id = %s AND id = %s",
-                (_uuid(owner_id), _uuid(card_id)),
+                f"EXECUTE {statement} (%s, %s)", (_uuid(owner_id), _uuid(card_id))
             )
             row = cur.fetchone()
-            if not row or not row[0]:
-                return None
-            return bytes(row[0])
+    return row[0] if row else None
 
 
 def restore_cards_with_policy(
@@ -1039,39 +1161,43 @@ def restore_cards_with_policy(
     normalized_entries = _group_restore_payload(cards)
     with get_connection() as conn:
         with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            # A restore is a single re-runnable transaction; don't wait on the
+            # WAL flush for it.
+            cur.execute("SET LOCAL synchronous_commit = off")
             if mode == "replace":
                 cur.execute(
                     "DELETE FROM cards WHERE owner_id = %s AND deck_id = %s",
                     (_uuid(owner_id), _uuid(deck_id)),
                 )
-                existing_entries: Dict[str, dict] = {}
+                rows = []
+                for entry in normalized_entries:
+                    entry_uuid = _safe_uuid(entry.get("entry_anki_id"))
+                    group_id = uuid.uuid4()
+                    for card in entry["cards"].values():
+                        rows.append(
+                            _entry_card_row(
+                                owner_id, deck_id, group_id, entry_uuid, card
+                            )
+                        )
+                inserted = _copy_card_rows(cur, rows)
             else:
                 existing_entries = _load_existing_entries(cur, owner_id, deck_id)
-            inserted = 0
-            for entry in normalized_entries:
-                inserted += _apply_entry_restore(
-                    cur,
-                    owner_id,
-                    deck_id,
-                    entry,
-                    mode,
-                    existing_entries,
-                )
+                pending: List[tuple] = []
+                for entry in normalized_entries:
+                    _apply_entry_restore(
+                        cur,
+                        pending,
+                        owner_id,
+                        deck_id,
+                        entry,
+                        mode,
+                        existing_entries,
+                    )
+                inserted = _insert_card_rows(cur, pending)
         conn.commit()
     return inserted
 
 
-def count_cards_in_deck(owner_id: uuid.UUID, deck_id: uuid.UUID) -> int:
-    with get_connection() as conn:
-        with conn.cursor() as cur:
-            cur.execute(
-                "SELECT COUNT(*) FROM cards WHERE owner_id = %s AND deck_id = %s",
-                (_uuid(owner_id), _uuid(deck_id)),
-            )
-            count = cur.fetchone()[0]
-    return count
-
-
 def _group_restore_payload(cards: List[dict]) -> List[dict]:
     grouped: Dict[str, dict] = {}
     for card in cards:
@@ -1136,6 +1262,7 @@ def _load_existing_entries(
 
 def _apply_entry_restore(
     cur,
+    pending: List[tuple],
     owner_id: uuid.UUID,
     deck_id: uuid.UUID,
     entry: dict,
@@ -1152,7 +1279,7 @@ def _apply_entry_restore(
 
     if mode == "prefer_newest" and existing:
         return _merge_entry(
-            cur, owner_id, deck_id, entry_uuid, existing, entry["cards"]
+            cur, pending, owner_id, deck_id, entry_uuid, existing, entry["cards"]
         )
 
     group_id = existing["group_id"] if existing else uuid.uuid4()
@@ -1162,7 +1289,7 @@ def _apply_entry_restore(
             (_uuid(owner_id), _uuid(deck_id), _uuid(existing["group_id"])),
         )
     inserted, inserted_cards = _insert_entry_cards(
-        cur,
+        pending,
         owner_id,
         deck_id,
         group_id,
@@ -1178,6 +1305,7 @@ def _apply_entry_restore(
 
 def _merge_entry(
     cur,
+    pending: List[tuple],
     owner_id: uuid.UUID,
     deck_id: uuid.UUID,
     entry_uuid: uuid.UUID,
@@ -1188,8 +1316,8 @@ def _merge_entry(
     for direction, card in incoming_cards.items():
         existing_card = existing_entry["cards"].get(direction)
         if not existing_card:
-            new_card_id = _insert_entry_card(
-                cur,
+            new_card_id = _queue_entry_card(
+                pending,
                 owner_id,
                 deck_id,
                 existing_entry["group_id"],
@@ -1210,8 +1338,8 @@ def _merge_entry(
             cur.execute(
                 "DELETE FROM cards WHERE id = %s", (_uuid(existing_card["id"]),)
             )
-            new_card_id = _insert_entry_card(
-                cur,
+            new_card_id = _queue_entry_card(
+                pending,
                 owner_id,
                 deck_id,
                 existing_entry["group_id"],
@@ -1227,7 +1355,7 @@ def _merge_entry(
 
 
 def _insert_entry_cards(
-    cur,
+    pending: List[tuple],
     owner_id: uuid.UUID,
     deck_id: uuid.UUID,
     group_id: uuid.UUID,
@@ -1237,7 +1365,9 @@ def _insert_entry_cards(
     inserted = 0
     inserted_cards: Dict[str, dict] = {}
     for direction, card in cards.items():
-        card_id = _insert_entry_card(cur, owner_id, deck_id, group_id, entry_uuid, card)
+        card_id = _queue_entry_card(
+            pending, owner_id, deck_id, group_id, entry_uuid, card
+        )
         inserted_cards[direction] = {
             "id": card_id,
             "updated_at": card.get("updated_at"),
@@ -1246,60 +1376,123 @@ def _insert_entry_cards(
     return inserted, inserted_cards
 
 
-def _insert_entry_card(
-    cur,
+_CARD_INSERT_COLUMNS = (
+    "id",
+    "card_group_id",
+    "entry_anki_id",
+    "deck_id",
+    "owner_id",
+    "direction",
+    "payload",
+    "front_audio",
+    "back_audio",
+    "audio_filename",
+    "created_at",
+    "updated_at",
+    "anki_id",
+    "difficulty",
+)
+
+_CARD_INSERT_TEMPLATE = "({})".format(
+    ", ".join(
+        "%s::jsonb" if column == "payload" else "%s" for column in _CARD_INSERT_COLUMNS
+    )
+)
+
+
+def _entry_card_row(
     owner_id: uuid.UUID,
     deck_id: uuid.UUID,
     group_id: uuid.UUID,
     entry_uuid: uuid.UUID,
     card: dict,
-) -> str:
-    card_id = uuid.uuid4()
-    payload = card.get("payload") or {}
+) -> tuple:
     created_at = card.get("created_at")
-    updated_at = card.get("updated_at") or created_at
-    front_audio = card.get("front_audio")
-    back_audio = card.get("back_audio")
     direction = card.get("direction")
-    card_anki_uuid = stable_card_uuid(entry_uuid, direction)
-    cur.execute(
-        """
-        INSERT INTO cards (
-            id,
-            card_group_id,
-            entry_anki_id,
-            deck_id,
-            owner_id,
-            direction,
-            payload,
-            front_audio,
-            back_audio,
-            audio_filename,
-            created_at,
-            updated_at,
-            anki_id,
-            difficulty
-        )
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """,
+    return (
+        _uuid(uuid.uuid4()),
+        _uuid(group_id),
+        _uuid(entry_uuid),
+        _uuid(deck_id),
+        _uuid(owner_id),
+        direction,
+        card.get("payload") or {},
+        card.get("front_audio") or None,
+        card.get("back_audio") or None,
+        card.get("audio_filename"),
+        created_at,
+        card.get("updated_at") or created_at,
+        _uuid(stable_card_uuid(entry_uuid, direction)),
+        card.get("difficulty"),
+    )
+
+
+def _queue_entry_card(
+    pending: List[tuple],
+    owner_id: uuid.UUID,
+    deck_id: uuid.UUID,
+    group_id: uuid.UUID,
+    entry_uuid: uuid.UUID,
+    card: dict,
+) -> str:
+    row = _entry_card_row(owner_id, deck_id, group_id, entry_uuid, card)
+    pending.append(row)
+    return row[0]
+
+
+def _insert_card_rows(cur, rows: List[tuple]) -> int:
+    """Insert queued restore rows with multi-row INSERTs (merge modes can't COPY)."""
+    if not rows:
+        return 0
+    # Payloads are serialized up front and cast server-side instead of going
+    # through a Json() adapter object per row.
+    values = [
         (
-            _uuid(card_id),
-            _uuid(group_id),
-            _uuid(entry_uuid),
-            _uuid(deck_id),
-            _uuid(owner_id),
-            direction,
-            Json(payload),
-            Binary(front_audio) if front_audio else None,
-            Binary(back_audio) if back_audio else None,
-            card.get("audio_filename"),
-            created_at,
-            updated_at,
-            _uuid(card_anki_uuid),
-            card.get("difficulty"),
-        ),
+            *row[:6],
+            json.dumps(row[6]),
+            Binary(row[7]) if row[7] else None,
+            Binary(row[8]) if row[8] else None,
+            *row[9:],
+        )
+        for row in rows
+    ]
+    execute_values(
+        cur,
+        f"INSERT INTO cards ({', '.join(_CARD_INSERT_COLUMNS)}) VALUES %s",
+        values,
+        template=_CARD_INSERT_TEMPLATE,
+        page_size=RESTORE_INSERT_PAGE_SIZE,
+    )
+    return len(rows)
+
+
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _copy_text_value(value) -> str:
+    if value is None:
+        return "\\N"
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        value = "\\x" + bytes(value).hex()
+    elif isinstance(value, (dict, list)):
+        value = json.dumps(value)
+    return str(value).translate(_COPY_ESCAPES)
+
+
+def _copy_card_rows(cur, rows: List[tuple]) -> int:
+    """Bulk load card rows with a single COPY instead of one INSERT per card."""
+    if not rows:
+        return 0
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write("\t".join(_copy_text_value(value) for value in row))
+        buffer.write("\n")
+    buffer.seek(0)
+    cur.copy_expert(
+        f"COPY cards ({', '.join(_CARD_INSERT_COLUMNS)}) FROM STDIN",
+        buffer,
     )
-    return str(card_id)
+    return len(rows)
 
 
 def _safe_uuid(value) -> uuid.UUID:
@@ -1,10 +1,11 @@
+import time
 import uuid
 from copy import deepcopy
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from psycopg2.extras import Json, RealDictCursor
 
-from ..db.core import get_connection
+from ..db.core import get_connection, prepare_statement
 from . import settings as settings_service
 
 
@@ -77,35 +78,55 @@ def _base_prompt_templates():
     }
 
 
-def default_prompt_templates():
+# The merged defaults are read several times per card action (audio config,
+# generation prompts, options). Keep them for as long as the settings cache.
+_prompt_defaults_cache: Optional[Tuple[float, dict]] = None
+
+
+def _shared_default_prompt_templates() -> dict:
+    """Merged defaults for read-only lookups; callers must not mutate them."""
+    global _prompt_defaults_cache
+    now = time.monotonic()
+    cached = _prompt_defaults_cache
+    if cached and now - cached[0] < settings_service.SETTING_CACHE_TTL_SECONDS:
+        return cached[1]
     base = _base_prompt_templates()
     stored = settings_service.get_json_setting(PROMPT_SETTINGS_KEY)
     if stored is None:
         settings_service.set_json_setting(PROMPT_SETTINGS_KEY, base)
-        return deepcopy(base)
-    return _merge_nested(base, stored)
+        merged = base
+    else:
+        merged = _merge_nested(base, stored)
+    _prompt_defaults_cache = (now, merged)
+    return merged
+
+
+def default_prompt_templates():
+    return deepcopy(_shared_default_prompt_templates())
 
 
 def update_default_prompt_templates(overrides: Optional[dict]) -> dict:
+    global _prompt_defaults_cache
     merged = _merge_nested(_base_prompt_templates(), overrides or {})
     settings_service.set_json_setting(PROMPT_SETTINGS_KEY, merged)
+    _prompt_defaults_cache = None
     return deepcopy(merged)
 
 
 def default_generation_prompts():
-    templates = default_prompt_templates()
+    templates = _shared_default_prompt_templates()
     generation = templates.get("generation") or {}
     return _merge_nested(_base_generation_prompts(), generation)
 
 
 def default_audio_instructions_template() -> str:
-    templates = default_prompt_templates()
+    templates = _shared_default_prompt_templates()
     audio_cfg = templates.get("audio") or {}
     return audio_cfg.get("instructions") or DEFAULT_AUDIO_INSTRUCTIONS_TEMPLATE
 
 
 def default_card_templates() -> dict:
-    templates = default_prompt_templates()
+    templates = _shared_default_prompt_templates()
     return {
         "forward": deepcopy(templates.get("forward") or {}),
         "backward": deepcopy(templates.get("backward") or {}),
@@ -130,7 +151,7 @@ def _apply_card_template_overrides(templates: dict, overrides: Optional[dict]) -
 
 
 def _resolved_audio_config(deck: Optional[dict]) -> dict:
-    base_audio = default_prompt_templates().get("audio") or {
+    base_audio = _shared_default_prompt_templates().get("audio") or {
         "instructions": DEFAULT_AUDIO_INSTRUCTIONS_TEMPLATE,
         "enabled": True,
     }
@@ -381,7 +402,9 @@ def list_recent_decks(owner_id: uuid.UUID, limit: int = 3) -> List[dict]:
 def get_deck(deck_id: uuid.UUID, owner_id: uuid.UUID) -> Optional[dict]:
     with get_connection() as conn:
         with conn.cursor(cursor_factory=RealDictCursor) as cur:
-            cur.execute(
+            prepare_statement(
+                cur,
+                "get_deck",
                 """
                 SELECT d.id,
                        d.anki_id,
@@ -395,9 +418,11 @@ def get_deck(deck_id: uuid.UUID, owner_id: uuid.UUID) -> Optional[dict]:
                        d.created_at,
                        d.updated_at
                 FROM decks d
-                WHERE d.id = %s AND d.owner_id = %s
+                WHERE d.id = $1::uuid AND d.owner_id = $2::uuid
                 """,
-                (_uuid(deck_id), _uuid(owner_id)),
+            )
+            cur.execute(
+                "EXECUTE get_deck (%s, %s)", (_uuid(deck_id), _uuid(owner_id))
             )
             deck = cur.fetchone()
     if not deck:
@@ -504,38 +529,39 @@ def update_deck(
     card_templates: Optional[dict] = None,
 ) -> Optional[dict]:
     schema = normalize_field_schema(field_schema)
+    # Resolve the merged templates before checking out a connection: get_deck
+    # and the defaults lookup take their own, and holding one while waiting for
+    # another can exhaust the pool.
+    prompts = None
+    if (
+        generation_prompts is not None
+        or audio_instructions is not None
+        or audio_enabled is not None
+        or card_templates is not None
+    ):
+        existing = get_deck(deck_id, owner_id)
+        if not existing:
+            return None
+        merged = deepcopy(existing.get("prompt_templates") or default_prompt_templates())
+        if generation_prompts is not None:
+            merged["generation"] = generation_prompts
+        if audio_instructions is not None:
+            instruction_text = (
+                audio_instructions or ""
+            ).strip() or DEFAULT_AUDIO_INSTRUCTIONS_TEMPLATE
+            audio_cfg = merged.get("audio") or {}
+            audio_cfg["instructions"] = instruction_text
+            merged["audio"] = audio_cfg
+        if audio_enabled is not None:
+            audio_cfg = merged.get("audio") or {}
+            audio_cfg["enabled"] = bool(audio_enabled)
+            merged["audio"] = audio_cfg
+        if card_templates is not None:
+            merged = _apply_card_template_overrides(merged, card_templates)
+        prompts = merged
+
     with get_connection() as conn:
         with conn.cursor(cursor_factory=RealDictCursor) as cur:
-            prompts = None
-            if (
-                generation_prompts is not None
-                or audio_instructions is not None
-                or audio_enabled is not None
-                or card_templates is not None
-            ):
-                existing = get_deck(deck_id, owner_id)
-                if not existing:
-                    return None
-                merged = deepcopy(
-                    existing.get("prompt_templates") or default_prompt_templates()
-                )
-                if generation_prompts is not None:
-                    merged["generation"] = generation_prompts
-                if audio_instructions is not None:
-                    instruction_text = (
-                        audio_instructions or ""
-                    ).strip() or DEFAULT_AUDIO_INSTRUCTIONS_TEMPLATE
-                    audio_cfg = merged.get("audio") or {}
-                    audio_cfg["instructions"] = instruction_text
-                    merged["audio"] = audio_cfg
-                if audio_enabled is not None:
-                    audio_cfg = merged.get("audio") or {}
-                    audio_cfg["enabled"] = bool(audio_enabled)
-                    merged["audio"] = audio_cfg
-                if card_templates is not None:
-                    merged = _apply_card_template_overrides(merged, card_templates)
-                prompts = merged
-
             if prompts is not None:
                 cur.execute(
                     """
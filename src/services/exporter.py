@@ -1,18 +1,53 @@
-import os
-import tempfile
+import hashlib
+import io
+import itertools
+import json
+import sqlite3
+import threading
+import time
 import uuid
+import zipfile
+from collections import OrderedDict
 from datetime import datetime
-from typing import List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional
 
 import genanki
 
-from .cards import stable_card_guid, strip_anki_sound_tags
+from .cards import audio_filename, stable_card_guid, strip_anki_sound_tags
+
+
+# Recently built packages keyed by a hash of their notes and media, so
+# re-exporting an unchanged deck skips the sqlite + zip build.
+PACKAGE_CACHE_SIZE = 4
+_package_cache: "OrderedDict[str, bytes]" = OrderedDict()
+_package_cache_lock = threading.Lock()
+
+MODEL_NAME = "Structured Two-Sided"
+MODEL_FIELDS = ({"name": "Front"}, {"name": "Back"})
+MODEL_TEMPLATES = (
+    {
+        "name": "Card",
+        "qfmt": "{{Front}}",
+        "afmt": "{{Front}}<hr id='answer'>{{Back}}",
+    },
+)
 
 
 def _anki_id(seed: str) -> int:
     return uuid.uuid5(uuid.NAMESPACE_OID, seed).int & 0x7FFFFFFF
 
 
+@lru_cache(maxsize=256)
+def _get_model(model_id: int) -> genanki.Model:
+    return genanki.Model(
+        model_id,
+        MODEL_NAME,
+        fields=list(MODEL_FIELDS),
+        templates=list(MODEL_TEMPLATES),
+    )
+
+
 class TimestampedNote(genanki.Note):
     def __init__(self, *args, updated_at: Optional[datetime] = None, **kwargs):
         self._note_timestamp = None
@@ -42,6 +77,63 @@ def _entry_uuid(card: dict) -> uuid.UUID:
         return uuid.uuid5(uuid.NAMESPACE_URL, f"fallback-entry-{seed}")
 
 
+def _queue_audio(
+    pending_media: Dict[str, bytes], card: dict, audio: Optional[bytes]
+) -> str:
+    """Register a card's audio for packaging and return its [sound:] tag."""
+    if not audio:
+        return ""
+    filename = card.get("audio_filename") or audio_filename(audio)
+    pending_media.setdefault(filename, audio)
+    return f"<br>[sound:{filename}]"
+
+
+class InMemoryPackage(genanki.Package):
+    """Build the .apkg from in-memory media, without temp files on disk."""
+
+    def __init__(self, deck: genanki.Deck, media: Dict[str, bytes]):
+        super().__init__(deck)
+        self.media = media
+
+    def to_bytes(self, timestamp: Optional[float] = None) -> bytes:
+        if timestamp is None:
+            timestamp = time.time()
+        conn = sqlite3.connect(":memory:")
+        try:
+            id_gen = itertools.count(int(timestamp * 1000))
+            self.write_to_db(conn.cursor(), timestamp, id_gen)
+            conn.commit()
+            collection = conn.serialize()
+        finally:
+            conn.close()
+
+        # Stable media order so numbering does not depend on card order.
+        filenames = sorted(self.media)
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as outzip:
+            outzip.writestr("collection.anki2", collection)
+            outzip.writestr("media", json.dumps(dict(enumerate(filenames))))
+            for idx, filename in enumerate(filenames):
+                outzip.writestr(str(idx), self.media[filename])
+        return buffer.getvalue()
+
+
+def _cached_package(key: str) -> Optional[bytes]:
+    with _package_cache_lock:
+        binary = _package_cache.get(key)
+        if binary is not None:
+            _package_cache.move_to_end(key)
+        return binary
+
+
+def _store_package(key: str, binary: bytes) -> None:
+    with _package_cache_lock:
+        _package_cache[key] = binary
+        _package_cache.move_to_end(key)
+        while len(_package_cache) > PACKAGE_CACHE_SIZE:
+            _package_cache.popitem(last=False)
+
+
 def export_deck(deck: dict, cards: List[dict]) -> bytes:
     deck_key = deck.get("anki_id") or deck.get("id")
     deck_identifier = _anki_id(f"deck-{deck_key}")
@@ -50,100 +142,76 @@ def export_deck(deck: dict, cards: List[dict]) -> bytes:
     anki_deck = genanki.Deck(
         deck_identifier, f"{deck['name']} ({deck['target_language']})"
     )
-    model = genanki.Model(
-        model_identifier,
-        "Structured Two-Sided",
-        fields=[
-            {"name": "Front"},
-            {"name": "Back"},
-        ],
-        templates=[
-            {
-                "name": "Card",
-                "qfmt": "{{Front}}",
-                "afmt": "{{Front}}<hr id='answer'>{{Back}}",
-            }
-        ],
-    )
-
-    media_files: List[str] = []
-    written_files = {}
-
-    with tempfile.TemporaryDirectory() as temp_dir:
-        for card in cards:
-            front_audio_tag = ""
-            back_audio_tag = ""
-            front_audio = card.get("front_audio")
-            back_audio = card.get("back_audio")
-
-            # Most cards only store audio on the back; move it to the front when the front
-            # contains the foreign text (forward direction) so pronunciation plays immediately.
-            if card.get("direction") == "forward" and not front_audio and back_audio:
-                front_audio = back_audio
-                back_audio = None
-
-            if front_audio:
-                filename = card.get("audio_filename") or f"{card['id']}_front.mp3"
-                file_path = written_files.get(filename)
-                if not file_path:
-                    file_path = os.path.join(temp_dir, filename)
-                    with open(file_path, "wb") as media_file:
-                        media_file.write(front_audio)
-                    media_files.append(file_path)
-                    written_files[filename] = file_path
-                front_audio_tag = f"<br>[sound:{filename}]"
-
-            if back_audio:
-                filename = card.get("audio_filename") or f"{card['id']}_back.mp3"
-                file_path = written_files.get(filename)
-                if not file_path:
-                    file_path = os.path.join(temp_dir, filename)
-                    with open(file_path, "wb") as media_file:
-                        media_file.write(back_audio)
-                    media_files.append(file_path)
-                    written_files[filename] = file_path
-                back_audio_tag = f"<br>[sound:{filename}]"
-
-            entry_uuid = _entry_uuid(card)
-            note_guid = stable_card_guid(entry_uuid, card.get("direction") or "forward")
-            # Anki requires tags to have no spaces — replace with underscore.
-            # Also deduplicate and skip empty strings.
-            raw_tags = [*(card.get("tag_names") or []), card.get("difficulty")]
-            safe_tags = list(
-                dict.fromkeys(
-                    t.strip().replace(" ", "_") for t in raw_tags if t and t.strip()
-                )
+    model = _get_model(model_identifier)
+
+    pending_media: Dict[str, bytes] = {}
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(repr((deck_identifier, model_identifier, anki_deck.name)).encode())
+
+    for card in cards:
+        front_audio = card.get("front_audio")
+        back_audio = card.get("back_audio")
+
+        # Most cards only store audio on the back; move it to the front when the front
+        # contains the foreign text (forward direction) so pronunciation plays immediately.
+        if card.get("direction") == "forward" and not front_audio and back_audio:
+            front_audio = back_audio
+            back_audio = None
+
+        front_audio_tag = _queue_audio(pending_media, card, front_audio)
+        back_audio_tag = _queue_audio(pending_media, card, back_audio)
+
+        entry_uuid = _entry_uuid(card)
+        note_guid = stable_card_guid(entry_uuid, card.get("direction") or "forward")
+        # Anki requires tags to have no spaces — replace with underscore.
+        # Also deduplicate and skip empty strings.
+        raw_tags = [*(card.get("tag_names") or []), card.get("difficulty")]
+        safe_tags = list(
+            dict.fromkeys(
+                t.strip().replace(" ", "_") for t in raw_tags if t and t.strip()
             )
-            front_content = (
-                card["anki_front_override"]
-                if card.get("anki_front_override") is not None
-                else card["front"]
-            )
-            back_content = (
-                card["anki_back_override"]
-                if card.get("anki_back_override") is not None
-                else card["back"]
-            )
-            front = f"{strip_anki_sound_tags(front_content)}{front_audio_tag}"
-            back = f"{strip_anki_sound_tags(back_content)}{back_audio_tag}"
-            card["_anki_front_exported"] = front
-            card["_anki_back_exported"] = back
-            note = TimestampedNote(
-                model=model,
-                fields=[
-                    front,
-                    back,
-                ],
-                guid=note_guid,
-                tags=safe_tags,
-                updated_at=card.get("updated_at"),
-                due=int(card.get("anki_due") or 0),
-            )
-            anki_deck.add_note(note)
-
-        package = genanki.Package(anki_deck)
-        package.media_files = media_files
-        output_path = os.path.join(temp_dir, "deck.apkg")
-        package.write_to_file(output_path)
-        with open(output_path, "rb") as apkg:
-            return apkg.read()
+        )
+        front_content = (
+            card["anki_front_override"]
+            if card.get("anki_front_override") is not None
+            else card["front"]
+        )
+        back_content = (
+            card["anki_back_override"]
+            if card.get("anki_back_override") is not None
+            else card["back"]
+        )
+        front = f"{strip_anki_sound_tags(front_content)}{front_audio_tag}"
+        back = f"{strip_anki_sound_tags(back_content)}{back_audio_tag}"
+        card["_anki_front_exported"] = front
+        card["_anki_back_exported"] = back
+        due = int(card.get("anki_due") or 0)
+        note = TimestampedNote(
+            model=model,
+            fields=[
+                front,
+                back,
+            ],
+            guid=note_guid,
+            tags=safe_tags,
+            updated_at=card.get("updated_at"),
+            due=due,
+        )
+        anki_deck.add_note(note)
+        digest.update(
+            repr(
+                (note_guid, front, back, safe_tags, due, note._note_timestamp)
+            ).encode()
+        )
+
+    for filename in sorted(pending_media):
+        digest.update(filename.encode())
+        digest.update(hashlib.blake2b(pending_media[filename]).digest())
+    package_key = digest.hexdigest()
+    cached = _cached_package(package_key)
+    if cached is not None:
+        return cached
+
+    binary = InMemoryPackage(anki_deck, pending_media).to_bytes()
+    _store_package(package_key, binary)
+    return binary
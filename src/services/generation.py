@@ -1,12 +1,28 @@
 import json
 import re
-from typing import Dict, List, Optional
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
-from ..chatgpt_tools.tts import generate_audio_binary
+from ..chatgpt_tools.tts import generate_audio_binary_async
 from ..settings import OPENAI_MODEL
 
+# Independent per-field completions for a single card run side by side here.
+_FIELD_POOL = ThreadPoolExecutor(max_workers=16, thread_name_prefix="field-gen")
+
+_CODE_FENCE_RE = re.compile(r"^```[a-z]*\n?")
+
+# Re-adding a phrase (another deck, a retried save) resolves to the same prompt,
+# so recent completions are reused instead of paying for the round trip again.
+COMPLETION_CACHE_SIZE = 512
+COMPLETION_CACHE_TTL_SECONDS = 60 * 60
+_completion_cache: "OrderedDict[tuple, Tuple[float, str]]" = OrderedDict()
+_completion_cache_lock = threading.Lock()
+
 DEFAULT_PROMPTS = {
     "translation": {
         "system": "You translate between languages and respond concisely.",
@@ -62,17 +78,40 @@ def _run_completion(
     prompt_cfg: Dict[str, str],
     context: Dict[str, str],
     model: Optional[str] = None,
+    refresh: bool = False,
 ) -> str:
     prompts = _format_prompt(prompt_cfg, context)
+    model = model or OPENAI_MODEL
+    # Scoped to the key and endpoint that paid for it: another user's (or a
+    # revoked) key must not be answered from this entry.
+    key = (
+        client.api_key,
+        str(client.base_url),
+        model,
+        prompts["system"],
+        prompts["user"],
+    )
+    if not refresh:
+        with _completion_cache_lock:
+            cached = _completion_cache.get(key)
+            if cached and time.monotonic() - cached[0] < COMPLETION_CACHE_TTL_SECONDS:
+                _completion_cache.move_to_end(key)
+                return cached[1]
     response = client.chat.completions.create(
-        model=model or OPENAI_MODEL,
+        model=model,
         temperature=0.2,
         messages=[
             {"role": "system", "content": prompts["system"]},
             {"role": "user", "content": prompts["user"]},
         ],
     )
-    return response.choices[0].message.content.strip()
+    content = response.choices[0].message.content.strip()
+    with _completion_cache_lock:
+        _completion_cache[key] = (time.monotonic(), content)
+        _completion_cache.move_to_end(key)
+        while len(_completion_cache) > COMPLETION_CACHE_SIZE:
+            _completion_cache.popitem(last=False)
+    return content
 
 
 def _should_generate_sentence(text: str) -> bool:
@@ -100,9 +139,12 @@ def generate_translation(
     prompts: Dict[str, Dict[str, str]],
     context: Dict[str, str],
     model: Optional[str] = None,
+    refresh: bool = False,
 ) -> str:
     prompt_cfg = prompts.get("translation") or DEFAULT_PROMPTS["translation"]
-    return _strip_quotes(_run_completion(client, prompt_cfg, context, model=model))
+    return _strip_quotes(
+        _run_completion(client, prompt_cfg, context, model=model, refresh=refresh)
+    )
 
 
 def generate_dictionary(
@@ -110,9 +152,10 @@ def generate_dictionary(
     prompts: Dict[str, Dict[str, str]],
     context: Dict[str, str],
     model: Optional[str] = None,
+    refresh: bool = False,
 ) -> str:
     prompt_cfg = prompts.get("dictionary") or DEFAULT_PROMPTS["dictionary"]
-    return _run_completion(client, prompt_cfg, context, model=model)
+    return _run_completion(client, prompt_cfg, context, model=model, refresh=refresh)
 
 
 def generate_sentence(
@@ -120,9 +163,10 @@ def generate_sentence(
     prompts: Dict[str, Dict[str, str]],
     context: Dict[str, str],
     model: Optional[str] = None,
+    refresh: bool = False,
 ) -> str:
     prompt_cfg = prompts.get("sentence") or DEFAULT_PROMPTS["sentence"]
-    return _run_completion(client, prompt_cfg, context, model=model)
+    return _run_completion(client, prompt_cfg, context, model=model, refresh=refresh)
 
 
 def generate_foreign_from_native(
@@ -186,30 +230,36 @@ def enrich_payload(
         "native_language": native_language,
     }
 
+    # Each field is its own completion and none depends on another, so issue
+    # them together and pay one round-trip of latency instead of three.
+    pending = {}
     if _can_generate_field(field_schema, "native_phrase") and not payload.get(
         "native_phrase"
     ):
-        payload["native_phrase"] = generate_translation(
-            client, generation_prompts, context, model=model
+        pending["native_phrase"] = _FIELD_POOL.submit(
+            generate_translation, client, generation_prompts, context, model=model
         )
 
     if _can_generate_field(field_schema, "dictionary_entry") and not payload.get(
         "dictionary_entry"
     ):
-        payload["dictionary_entry"] = generate_dictionary(
-            client, generation_prompts, context, model=model
+        pending["dictionary_entry"] = _FIELD_POOL.submit(
+            generate_dictionary, client, generation_prompts, context, model=model
         )
 
     if _can_generate_field(field_schema, "example_sentence") and not payload.get(
         "example_sentence"
     ):
         if _should_generate_sentence(foreign_phrase):
-            payload["example_sentence"] = generate_sentence(
-                client, generation_prompts, context, model=model
+            pending["example_sentence"] = _FIELD_POOL.submit(
+                generate_sentence, client, generation_prompts, context, model=model
             )
         else:
             payload["example_sentence"] = foreign_phrase
 
+    for field_key, future in pending.items():
+        payload[field_key] = future.result()
+
     return payload
 
 
@@ -237,15 +287,15 @@ def regenerate_field(
 
     if field == "native_phrase":
         payload["native_phrase"] = generate_translation(
-            client, generation_prompts, context, model=model
+            client, generation_prompts, context, model=model, refresh=True
         )
     elif field == "dictionary_entry":
         payload["dictionary_entry"] = generate_dictionary(
-            client, generation_prompts, context, model=model
+            client, generation_prompts, context, model=model, refresh=True
         )
     elif field == "example_sentence":
         payload["example_sentence"] = generate_sentence(
-            client, generation_prompts, context, model=model
+            client, generation_prompts, context, model=model, refresh=True
         )
     else:
         raise ValueError("Unsupported field regeneration.")
@@ -310,7 +360,7 @@ def infer_tags(
         raw = response.choices[0].message.content.strip()
         # Strip markdown code fences if present
         if raw.startswith("```"):
-            raw = re.sub(r"^```[a-z]*\n?", "", raw).rstrip("`").strip()
+            raw = _CODE_FENCE_RE.sub("", raw).rstrip("`").strip()
         suggested = json.loads(raw)
         if not isinstance(suggested, list):
             return []
@@ -349,8 +399,8 @@ def infer_difficulty(client: OpenAI, payload: Dict[str, str], target_language: s
         return None
 
 
-def generate_audio_for_phrase(
-    client: OpenAI,
+async def generate_audio_for_phrase_async(
+    client: AsyncOpenAI,
     text: str,
     *,
     voice: str = "random",
@@ -359,7 +409,7 @@ def generate_audio_for_phrase(
 ) -> Optional[bytes]:
     if not text.strip():
         return None
-    return generate_audio_binary(
+    return await generate_audio_binary_async(
         client,
         text.strip(),
         voice=voice,
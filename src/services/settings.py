@@ -1,18 +1,29 @@
-from typing import Any, Optional
+import time
+from copy import deepcopy
+from typing import Any, Dict, Optional, Tuple
 
 from psycopg2.extras import Json, RealDictCursor
 
 from ..db.core import get_connection
 
+# Settings are read on most deck requests but change only from the admin page.
+# Cache each key briefly per process; other workers see writes after the TTL.
+SETTING_CACHE_TTL_SECONDS = 30.0
+_setting_cache: Dict[str, Tuple[float, Optional[dict]]] = {}
+
 
 def get_json_setting(key: str) -> Optional[dict]:
+    now = time.monotonic()
+    cached = _setting_cache.get(key)
+    if cached and now - cached[0] < SETTING_CACHE_TTL_SECONDS:
+        return deepcopy(cached[1])
     with get_connection() as conn:
         with conn.cursor(cursor_factory=RealDictCursor) as cur:
             cur.execute("SELECT value FROM app_settings WHERE key = %s", (key,))
             row = cur.fetchone()
-    if not row:
-        return None
-    return row["value"]
+    value = row["value"] if row else None
+    _setting_cache[key] = (now, value)
+    return deepcopy(value)
 
 
 def set_json_setting(key: str, value: Any) -> None:
@@ -29,3 +40,4 @@ def set_json_setting(key: str, value: Any) -> None:
                 (key, Json(value)),
             )
         conn.commit()
+    _setting_cache.pop(key, None)
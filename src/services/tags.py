@@ -1,7 +1,7 @@
 import uuid
-from typing import List, Optional
+from typing import Dict, List, Optional
 
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import RealDictCursor, execute_values
 
 from ..db.core import get_connection
 
@@ -51,6 +51,25 @@ def list_deck_tags(deck_id: uuid.UUID) -> List[dict]:
     return [dict(row) for row in rows]
 
 
+def _tag_row(deck_id: uuid.UUID, tag: dict) -> tuple:
+    """Normalize one tag into a deck_tags insert row; raises ValueError if invalid."""
+    safe_name = (tag.get("name") or "").strip().replace(" ", "_")
+    if not safe_name:
+        raise ValueError("Tag name cannot be empty.")
+    category = (tag.get("category") or "").strip()
+    if category.casefold() == "cefr":
+        raise ValueError("CEFR is card difficulty, not a tag category.")
+    return (
+        _uuid(uuid.uuid4()),
+        _uuid(deck_id),
+        safe_name,
+        category,
+        (tag.get("color") or "").strip() or "#6366f1",
+        tag.get("sort_order", 0),
+        bool(tag.get("category_exclusive", False)),
+    )
+
+
 def create_tag(
     deck_id: uuid.UUID,
     *,
@@ -60,13 +79,16 @@ def create_tag(
     sort_order: int = 0,
     category_exclusive: bool = False,
 ) -> dict:
-    tag_id = uuid.uuid4()
-    safe_name = name.strip().replace(" ", "_")
-    if not safe_name:
-        raise ValueError("Tag name cannot be empty.")
-
-    if category.strip().casefold() == "cefr":
-        raise ValueError("CEFR is card difficulty, not a tag category.")
+    tag_row = _tag_row(
+        deck_id,
+        {
+            "name": name,
+            "category": category,
+            "color": color,
+            "sort_order": sort_order,
+            "category_exclusive": category_exclusive,
+        },
+    )
     with get_connection() as conn:
         with conn.cursor(cursor_factory=RealDictCursor) as cur:
             cur.execute(
@@ -76,40 +98,40 @@ def create_tag(
                 ON CONFLICT (deck_id, name) DO NOTHING
                 RETURNING id, deck_id, name, category, color, sort_order, category_exclusive, created_at
                 """,
-                (
-                    _uuid(tag_id),
-                    _uuid(deck_id),
-                    safe_name,
-                    category.strip(),
-                    color.strip() or "#6366f1",
-                    sort_order,
-                    category_exclusive,
-                ),
+                tag_row,
             )
             row = cur.fetchone()
         conn.commit()
     if not row:
-        raise ValueError(f"Tag '{safe_name}' already exists in this deck.")
+        raise ValueError(f"Tag '{tag_row[2]}' already exists in this deck.")
     return dict(row)
 
 
 def bulk_create_tags(deck_id: uuid.UUID, tags: List[dict]) -> List[dict]:
     """Create multiple tags at once (used for preset seeding)."""
-    created = []
+    rows = []
     for tag in tags:
         try:
-            result = create_tag(
-                deck_id,
-                name=tag.get("name", ""),
-                category=tag.get("category", ""),
-                color=tag.get("color", "#6366f1"),
-                sort_order=tag.get("sort_order", 0),
-                category_exclusive=bool(tag.get("category_exclusive", False)),
-            )
-            created.append(result)
+            rows.append(_tag_row(deck_id, tag))
         except ValueError:
-            pass  # skip duplicates
-    return created
+            continue  # presets skip invalid entries instead of failing the seed
+    if not rows:
+        return []
+    with get_connection() as conn:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            created = execute_values(
+                cur,
+                """
+                INSERT INTO deck_tags (id, deck_id, name, category, color, sort_order, category_exclusive)
+                VALUES %s
+                ON CONFLICT (deck_id, name) DO NOTHING
+                RETURNING id, deck_id, name, category, color, sort_order, category_exclusive, created_at
+                """,
+                rows,
+                fetch=True,
+            )
+        conn.commit()
+    return [dict(row) for row in created]
 
 
 def update_tag(
@@ -212,11 +234,11 @@ def set_card_group_tags(
                 (_uuid(card_group_id),),
             )
             if tag_ids:
-                for tag_id in tag_ids:
-                    cur.execute(
-                        "INSERT INTO card_tags (card_group_id, tag_id) VALUES (%s, %s) ON CONFLICT DO NOTHING",
-                        (_uuid(card_group_id), _uuid(tag_id)),
-                    )
+                execute_values(
+                    cur,
+                    "INSERT INTO card_tags (card_group_id, tag_id) VALUES %s ON CONFLICT DO NOTHING",
+                    [(_uuid(card_group_id), _uuid(tag_id)) for tag_id in tag_ids],
+                )
             cur.execute(
                 """
                 SELECT dt.id, dt.name, dt.category, dt.color, dt.sort_order, dt.category_exclusive
@@ -232,6 +254,36 @@ def set_card_group_tags(
     return [dict(row) for row in rows]
 
 
+def add_tags_to_card_groups(
+    deck_id: uuid.UUID, assignments: Dict[uuid.UUID, List[uuid.UUID]]
+) -> None:
+    """Attach tags to many card groups in one statement (additive, no replace).
+
+    Tag ids that are not (or no longer) in the deck are skipped.
+    """
+    group_ids: List[str] = []
+    tag_ids: List[str] = []
+    for group_id, group_tag_ids in assignments.items():
+        for tag_id in group_tag_ids:
+            group_ids.append(_uuid(group_id))
+            tag_ids.append(_uuid(tag_id))
+    if not group_ids:
+        return
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                INSERT INTO card_tags (card_group_id, tag_id)
+                SELECT a.card_group_id, a.tag_id
+                FROM unnest(%s::uuid[], %s::uuid[]) AS a (card_group_id, tag_id)
+                JOIN deck_tags dt ON dt.id = a.tag_id AND dt.deck_id = %s
+                ON CONFLICT DO NOTHING
+                """,
+                (group_ids, tag_ids, _uuid(deck_id)),
+            )
+        conn.commit()
+
+
 def get_tags_for_card_groups(card_group_ids: List[str]) -> dict:
     """Batch-fetch tags for multiple card groups. Returns {group_id: [tags]}."""
     if not card_group_ids:
@@ -4,7 +4,7 @@ from typing import Iterable, List, Optional
 
 from psycopg2.extras import RealDictCursor
 
-from ..db.core import get_connection
+from ..db.core import get_connection, prepare_statement
 
 _EMAIL_RE = re.compile(r"^[^@\s]{1,64}@[^@\s]{1,253}\.[^@.\s]{2,}$")
 
@@ -16,35 +16,32 @@ def _uuid(value: uuid.UUID) -> str:
 def ensure_user(email: str, auto_admin_emails: Optional[Iterable[str]] = None) -> dict:
     """
     Look up (or create) the user associated with the given email.
-    Returns a dict containing id, native_language, primary_email.
+    Returns the same fields as get_user, so request handlers can use the
+    authenticated user as-is instead of re-reading it.
     """
     normalized_email = email.strip().lower()
     auto_admin = {item.strip().lower() for item in (auto_admin_emails or []) if item}
     with get_connection() as conn:
         with conn.cursor(cursor_factory=RealDictCursor) as cur:
-            cur.execute(
+            # Runs on every authenticated request; keep the plan prepared.
+            prepare_statement(
+                cur,
+                "ensure_user_lookup",
                 """
                 SELECT u.id, u.native_language, u.created_at, u.is_admin,
                        u.text_model, u.audio_model, u.theme, u.models_locked,
-                       ue.email AS primary_email
+                       COALESCE(pe.email, ue.email) AS primary_email
                 FROM user_emails ue
                 JOIN users u ON u.id = ue.user_id
-                WHERE LOWER(ue.email) = %s
+                LEFT JOIN user_emails pe
+                       ON pe.user_id = u.id AND pe.is_primary = TRUE
+                WHERE LOWER(ue.email) = $1::text
                 """,
-                (normalized_email,),
             )
+            cur.execute("EXECUTE ensure_user_lookup (%s)", (normalized_email,))
             row = cur.fetchone()
             if row:
-                user = {
-                    "id": row["id"],
-                    "native_language": row["native_language"],
-                    "primary_email": row["primary_email"],
-                    "is_admin": row["is_admin"],
-                    "text_model": row.get("text_model"),
-                    "audio_model": row.get("audio_model"),
-                    "theme": row.get("theme") or "system",
-                    "models_locked": bool(row.get("models_locked")),
-                }
+                user = _user_from_row(row)
                 should_be_admin = normalized_email in auto_admin
                 if should_be_admin and not row["is_admin"]:
                     cur.execute(
@@ -73,16 +70,14 @@ def ensure_user(email: str, auto_admin_emails: Optional[Iterable[str]] = None) -
                 (_uuid(email_id), _uuid(user_id), normalized_email),
             )
             conn.commit()
-            return {
-                "id": user_id,
-                "native_language": None,
-                "primary_email": normalized_email,
-                "is_admin": is_admin,
-                "text_model": None,
-                "audio_model": None,
-                "theme": "system",
-                "models_locked": False,
-            }
+            return _user_from_row(
+                {
+                    "id": user_id,
+                    "native_language": None,
+                    "primary_email": normalized_email,
+                    "is_admin": is_admin,
+                }
+            )
 
 
 def set_native_language(user_id: uuid.UUID, language: str):
@@ -112,16 +107,57 @@ def get_user(user_id: uuid.UUID) -> Optional[dict]:
             row = cur.fetchone()
             if not row:
                 return None
-            return {
-                "id": row["id"],
-                "native_language": row["native_language"],
-                "primary_email": row.get("primary_email"),
-                "is_admin": row["is_admin"],
-                "text_model": row.get("text_model"),
-                "audio_model": row.get("audio_model"),
-                "theme": row.get("theme") or "system",
-                "models_locked": bool(row.get("models_locked")),
-            }
+            return _user_from_row(row)
+
+
+def get_user_with_emails(user_id: uuid.UUID) -> Optional[dict]:
+    """Like get_user, with the user's emails under "emails" in the same query."""
+    with get_connection() as conn:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            cur.execute(
+                """
+                SELECT u.id, u.native_language, u.is_admin,
+                       u.text_model, u.audio_model, u.theme, u.models_locked,
+                       ue.email AS primary_email,
+                       COALESCE(
+                           (
+                               SELECT json_agg(
+                                   json_build_object(
+                                       'id', e.id,
+                                       'email', e.email,
+                                       'is_primary', e.is_primary,
+                                       'created_at', e.created_at
+                                   )
+                                   ORDER BY e.is_primary DESC, e.created_at ASC
+                               )
+                               FROM user_emails e
+                               WHERE e.user_id = u.id
+                           ),
+                           '[]'::json
+                       ) AS emails
+                FROM users u
+                LEFT JOIN user_emails ue ON ue.user_id = u.id AND ue.is_primary = TRUE
+                WHERE u.id = %s
+                """,
+                (_uuid(user_id),),
+            )
+            row = cur.fetchone()
+    if not row:
+        return None
+    return {**_user_from_row(row), "emails": row["emails"]}
+
+
+def _user_from_row(row: dict) -> dict:
+    return {
+        "id": row["id"],
+        "native_language": row["native_language"],
+        "primary_email": row.get("primary_email"),
+        "is_admin": row["is_admin"],
+        "text_model": row.get("text_model"),
+        "audio_model": row.get("audio_model"),
+        "theme": row.get("theme") or "system",
+        "models_locked": bool(row.get("models_locked")),
+    }
 
 
 def set_user_theme(user_id: uuid.UUID, theme: str) -> None:
@@ -166,23 +202,29 @@ def set_models_locked(user_id: uuid.UUID, locked: bool) -> None:
         conn.commit()
 
 
+def _fetch_user_emails(cur, user_id: uuid.UUID) -> List[dict]:
+    cur.execute(
+        """
+        SELECT id, email, is_primary, created_at
+        FROM user_emails
+        WHERE user_id = %s
+        ORDER BY is_primary DESC, created_at ASC
+        """,
+        (_uuid(user_id),),
+    )
+    return cur.fetchall()
+
+
 def list_user_emails(user_id: uuid.UUID) -> List[dict]:
     with get_connection() as conn:
         with conn.cursor(cursor_factory=RealDictCursor) as cur:
-            cur.execute(
-                """
-                SELECT id, email, is_primary, created_at
-                FROM user_emails
-                WHERE user_id = %s
-                ORDER BY is_primary DESC, created_at ASC
-                """,
-                (_uuid(user_id),),
-            )
-            rows = cur.fetchall()
-    return rows
+            return _fetch_user_emails(cur, user_id)
 
 
-def add_user_email(user_id: uuid.UUID, email: str, *, make_primary: bool = False):
+def add_user_email(
+    user_id: uuid.UUID, email: str, *, make_primary: bool = False
+) -> List[dict]:
+    """Link an email to the user and return the user's updated email list."""
     normalized = (email or "").strip().lower()
     if not normalized or not _EMAIL_RE.match(normalized):
         raise ValueError("Enter a valid email address.")
@@ -205,18 +247,13 @@ def add_user_email(user_id: uuid.UUID, email: str, *, make_primary: bool = False
                 (email_id, _uuid(user_id), normalized),
             )
             if make_primary:
-                cur.execute(
-                    "UPDATE user_emails SET is_primary = FALSE WHERE user_id = %s",
-                    (_uuid(user_id),),
-                )
-                cur.execute(
-                    "UPDATE user_emails SET is_primary = TRUE WHERE id = %s",
-                    (email_id,),
-                )
+                _set_primary(cur, user_id, email_id)
+            emails = _fetch_user_emails(cur, user_id)
         conn.commit()
+    return emails
 
 
-def remove_user_email(user_id: uuid.UUID, email_id: uuid.UUID):
+def remove_user_email(user_id: uuid.UUID, email_id: uuid.UUID) -> List[dict]:
     with get_connection() as conn:
         with conn.cursor(cursor_factory=RealDictCursor) as cur:
             cur.execute(
@@ -236,10 +273,19 @@ def remove_user_email(user_id: uuid.UUID, email_id: uuid.UUID):
                 "DELETE FROM user_emails WHERE id = %s",
                 (_uuid(email_id),),
             )
+            emails = _fetch_user_emails(cur, user_id)
         conn.commit()
+    return emails
+
 
+def _set_primary(cur, user_id: uuid.UUID, email_id) -> None:
+    cur.execute(
+        "UPDATE user_emails SET is_primary = (id = %s) WHERE user_id = %s",
+        (_uuid(email_id), _uuid(user_id)),
+    )
 
-def set_primary_email(user_id: uuid.UUID, email_id: uuid.UUID):
+
+def set_primary_email(user_id: uuid.UUID, email_id: uuid.UUID) -> List[dict]:
     with get_connection() as conn:
         with conn.cursor(cursor_factory=RealDictCursor) as cur:
             cur.execute(
@@ -252,15 +298,10 @@ def set_primary_email(user_id: uuid.UUID, email_id: uuid.UUID):
             row = cur.fetchone()
             if not row:
                 raise ValueError("Email not found.")
-            cur.execute(
-                "UPDATE user_emails SET is_primary = FALSE WHERE user_id = %s",
-                (_uuid(user_id),),
-            )
-            cur.execute(
-                "UPDATE user_emails SET is_primary = TRUE WHERE id = %s",
-                (_uuid(email_id),),
-            )
+            _set_primary(cur, user_id, email_id)
+            emails = _fetch_user_emails(cur, user_id)
         conn.commit()
+    return emails
 
 
 def delete_user(user_id: uuid.UUID) -> bool:
@@ -272,14 +313,27 @@ def delete_user(user_id: uuid.UUID) -> bool:
     return deleted
 
 
-def set_admin_status(user_id: uuid.UUID, is_admin: bool):
+def set_admin_status(user_id: uuid.UUID, is_admin: bool) -> Optional[dict]:
+    """Update the admin flag and return the updated user in the same statement."""
     with get_connection() as conn:
-        with conn.cursor() as cur:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
             cur.execute(
-                "UPDATE users SET is_admin = %s WHERE id = %s",
+                """
+                WITH updated AS (
+                    UPDATE users SET is_admin = %s WHERE id = %s
+                    RETURNING id, native_language, is_admin,
+                              text_model, audio_model, theme, models_locked
+                )
+                SELECT updated.*, ue.email AS primary_email
+                FROM updated
+                LEFT JOIN user_emails ue
+                    ON ue.user_id = updated.id AND ue.is_primary = TRUE
+                """,
                 (is_admin, _uuid(user_id)),
             )
+            row = cur.fetchone()
         conn.commit()
+    return _user_from_row(row) if row else None
 
 
 def list_all_users(page: int = 1, limit: int = 50) -> dict:
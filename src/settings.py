@@ -9,10 +9,12 @@ load_dotenv()
 
 LOCAL_USER_EMAIL = os.getenv("LOCAL_USER_EMAIL", "local@example.com")
 ALLOW_LOCAL_USER = os.getenv("ALLOW_LOCAL_USER", "true").lower() in {"1", "true", "yes"}
-ALWAYS_ADMIN_EMAILS = get_auto_admin_emails(LOCAL_USER_EMAIL)
+ALWAYS_ADMIN_EMAILS = frozenset(get_auto_admin_emails(LOCAL_USER_EMAIL))
 
 NATIVE_LANGUAGE_OPTIONS = ["English"]
 TARGET_LANGUAGE_OPTIONS = ["Danish", "Hungarian"]
+NATIVE_LANGUAGE_SET = frozenset(NATIVE_LANGUAGE_OPTIONS)
+TARGET_LANGUAGE_SET = frozenset(TARGET_LANGUAGE_OPTIONS)
 
 DEFAULT_FRONTEND_ORIGINS = ["http://localhost:5173"]
 FRONTEND_ORIGINS: List[str] = [
@@ -28,5 +30,14 @@ POSTGRES_DB = os.getenv("POSTGRES_DB", "postgres")
 POSTGRES_USER = os.getenv("POSTGRES_USER", "postgres")
 POSTGRES_PASSWORD = os.getenv("POSTGRES_PASSWORD", "postgres")
 POSTGRES_PORT = os.getenv("POSTGRES_PORT", "7654")
+DB_POOL_MIN_CONN = int(os.getenv("DB_POOL_MIN_CONN", "1"))
+DB_POOL_MAX_CONN = int(os.getenv("DB_POOL_MAX_CONN", "20"))
+DB_POOL_TIMEOUT_SECONDS = float(os.getenv("DB_POOL_TIMEOUT_SECONDS", "30"))
+# Sync endpoints run on AnyIO's worker threads; its default of 40 caps how many
+# requests can wait on Postgres or OpenAI at once.
+THREADPOOL_MAX_WORKERS = int(os.getenv("THREADPOOL_MAX_WORKERS", "100"))
 
 OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-5.4-nano")
+# The SDK retries 429s, 5xx and dropped connections with jittered exponential
+# backoff (honouring Retry-After); its default of 2 gives up quickly on bulk runs.
+OPENAI_MAX_RETRIES = int(os.getenv("OPENAI_MAX_RETRIES", "4"))
@@ -7,6 +7,11 @@ sys.modules["pydub"] = MagicMock()
 sys.modules["ffmpeg"] = MagicMock()
 sys.modules["psycopg2"] = MagicMock()
 sys.modules["psycopg2.extras"] = MagicMock()
+sys.modules["psycopg2.pool"] = MagicMock()
+sys.modules["psycopg2.pool"].PoolError = type("PoolError", (Exception,), {})
+sys.modules["psycopg2.extensions"] = MagicMock()
+# db.core subclasses the driver's connection class, so it must be a real class.
+sys.modules["psycopg2.extensions"].connection = type("connection", (), {})
 sys.modules["jinja2"] = MagicMock()
 
 import unittest
@@ -41,7 +46,7 @@ class TestPagination(unittest.TestCase):
         
         # 1. Count query
         mock_cursor.fetchone.side_effect = [
-            {"total": 10}, # First call: count
+            {"total": 10, "card_total": 15}, # First call: group and card counts
         ]
         
         # 2. Groups query
@@ -92,6 +97,7 @@ class TestPagination(unittest.TestCase):
         
         # Verify
         self.assertEqual(result["total"], 10)
+        self.assertEqual(result["card_total"], 15)
         self.assertEqual(result["page"], 1)
         self.assertEqual(result["limit"], 2)
         self.assertEqual(result["pages"], 5)